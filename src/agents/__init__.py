@@ -2,80 +2,68 @@
 
 This module provides the agent abstraction layer for story generation.
 Agents can be discovered via entry points from installed packages.
-"""
-
-from agents.protocols import Architect, Editor, Narrator
-from agents.discovery import (
-    discover_architects,
-    discover_character_agent_types,
-    discover_editors,
-    discover_narrators,
-    get_architect,
-    get_character_agent_type,
-    get_editor,
-    get_narrator,
-    list_architects,
-    list_character_agent_types,
-    list_editors,
-    list_narrators,
-)
 
-# Import built-in agents from their respective modules
-from agents.architect import DefaultArchitect
-from agents.editor import DefaultEditor
-from agents.narrative import DefaultNarrator
+Attributes are resolved lazily (PEP 562) so that ``import agents`` doesn't
+eagerly pull in every agent implementation — and, transitively, langchain —
+when only a subset is needed.
+"""
 
-# Import character agent components
-from agents.character import (
-    AnswerInput,
-    CharacterAgent,
-    CharacterAgentType,
-    CharacterRegistry,
-    CharacterResponse,
-    ChooseInput,
-    SpeakInput,
-    ThinkInput,
-)
-from agents.character.character_default import (
-    DefaultCharacterAgent,
-    DefaultCharacterAgentType,
-)
-from agents.character.character_mbti import MBTICharacterAgent, MBTICharacterAgentType
+import importlib
 
-__all__ = [
+# Maps each public attribute to the submodule that defines it.
+_LAZY = {
     # Protocols
-    "Architect",
-    "Editor",
-    "Narrator",
+    "Architect": "agents.protocols",
+    "Editor": "agents.protocols",
+    "Narrator": "agents.protocols",
     # Discovery
-    "discover_architects",
-    "discover_character_agent_types",
-    "discover_editors",
-    "discover_narrators",
-    "get_architect",
-    "get_character_agent_type",
-    "get_editor",
-    "get_narrator",
-    "list_architects",
-    "list_character_agent_types",
-    "list_editors",
-    "list_narrators",
+    "discover_architects": "agents.discovery",
+    "discover_character_agent_types": "agents.discovery",
+    "discover_editors": "agents.discovery",
+    "discover_narrators": "agents.discovery",
+    "get_architect": "agents.discovery",
+    "get_character_agent_type": "agents.discovery",
+    "get_editor": "agents.discovery",
+    "get_narrator": "agents.discovery",
+    "list_architects": "agents.discovery",
+    "list_character_agent_types": "agents.discovery",
+    "list_editors": "agents.discovery",
+    "list_narrators": "agents.discovery",
     # Built-in implementations
-    "DefaultArchitect",
-    "DefaultEditor",
-    "DefaultNarrator",
+    "DefaultArchitect": "agents.architect",
+    "DefaultEditor": "agents.editor",
+    "DefaultNarrator": "agents.narrative",
     # Character agent protocols and models
-    "AnswerInput",
-    "CharacterAgent",
-    "CharacterAgentType",
-    "CharacterRegistry",
-    "CharacterResponse",
-    "ChooseInput",
-    "SpeakInput",
-    "ThinkInput",
+    "AnswerInput": "agents.character",
+    "CharacterAgent": "agents.character",
+    "CharacterAgentType": "agents.character",
+    "CharacterRegistry": "agents.character",
+    "CharacterResponse": "agents.character",
+    "ChooseInput": "agents.character",
+    "SpeakInput": "agents.character",
+    "ThinkInput": "agents.character",
     # Character agent implementations
-    "DefaultCharacterAgent",
-    "DefaultCharacterAgentType",
-    "MBTICharacterAgent",
-    "MBTICharacterAgentType",
-]
+    "DefaultCharacterAgent": "agents.character.character_default",
+    "DefaultCharacterAgentType": "agents.character.character_default",
+    "MBTICharacterAgent": "agents.character.character_mbti",
+    "MBTICharacterAgentType": "agents.character.character_mbti",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Load the submodule defining `name` on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so subsequent accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,27 @@
+"""Shared LLM client construction for agents.
+
+Every agent previously built its own ChatAnthropic instance, repeating
+HTTP-client and auth setup per agent (and per character, for casts). The
+client is stateless and thread-safe, so one instance per model name can
+serve the whole process and share its connection pool.
+"""
+
+from functools import cache
+
+
+@cache
+def get_chat_anthropic(model: str):
+    """Return the process-wide ChatAnthropic client for a model name.
+
+    Imported lazily so modules using this helper stay cheap to import;
+    the LangChain/Anthropic stack loads on the first actual model use.
+
+    Args:
+        model: The Anthropic model identifier.
+
+    Returns:
+        The shared ChatAnthropic instance for that model.
+    """
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model=model)
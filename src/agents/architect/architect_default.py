@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import sys
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import structlog
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate
 
+from agents._llm import get_chat_anthropic
 from models import ArchitectInput, PlotEvent, StoryArchitecture
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from tools.registry import ToolRegistry
 
 log = structlog.get_logger(__name__)
@@ -56,106 +61,479 @@ Create a plot event that naturally follows from the story so far (or begins the
 Ensure beats flow logically and advance the narrative."""
 
 
+DRAFT_PREVIOUS_EVENTS_SECTION = """**Previous Plot Events:** Not available \
+(draft mode — the other plot events are being generated in parallel). Focus on making \
+this event work at its stated position in the overall arc."""
+
+
+FUSED_USER_PROMPT_TEMPLATE = """## Story Context
+
+**Story Idea:** {story_idea}
+
+**Tone:** {tone}
+
+**Characters:**
+{characters_text}
+
+## Current Task
+
+Generate all {total_events} plot events for this story in a single pass.
+
+Create between {min_beats} and {max_beats} story beats for each plot event.
+
+Ensure the plot events build on one another with natural narrative progression, \
+and that beats within each event flow logically and advance the story."""
+
+
+# Stories at or below this many plot events are generated in one fused LLM
+# call rather than one round trip per event.
+FUSE_THRESHOLD = 3
+
+
+_CHAR_TEMPLATE = """### {name} ({role})
+**Description:** {description}
+**Motivations:** {motivations}
+**Relationships:** {relationships}
+**Backstory:** {backstory}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _plot_event_tool() -> dict:
+    """Build the Anthropic tool schema for PlotEvent once per process.
+
+    with_structured_output regenerates the JSON schema from the Pydantic
+    model on every binding; precomputing it means new architect instances
+    reuse the same schema dict instead of re-walking the nested models.
+    """
+    return {
+        "name": "PlotEvent",
+        "description": "A major plot point containing story beats.",
+        "input_schema": PlotEvent.model_json_schema(),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _story_architecture_tool() -> dict:
+    """Build the Anthropic tool schema for StoryArchitecture once per process."""
+    return {
+        "name": "StoryArchitecture",
+        "description": "Complete story structure with all plot events and their beats.",
+        "input_schema": StoryArchitecture.model_json_schema(),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _system_message():
+    """Build the shared system message once, importing langchain lazily.
+
+    The langchain imports are deferred to first use so that importing this
+    module (e.g., for discovery listing) doesn't pay the full langchain /
+    anthropic SDK import cost.
+    """
+    from langchain_core.messages import SystemMessage
+
+    return SystemMessage(content=SYSTEM_PROMPT)
+
+
+def _build_fused_messages(payload: dict) -> list:
+    """Render the prompt messages for a whole-architecture fused request."""
+    from langchain_core.messages import HumanMessage
+
+    return [
+        _system_message(),
+        HumanMessage(content=FUSED_USER_PROMPT_TEMPLATE.format_map(payload)),
+    ]
+
+
+def _build_messages(payload: dict) -> list:
+    """Render the prompt messages for one plot-event payload.
+
+    The user message is formatted directly with str.format_map rather than
+    going through ChatPromptTemplate, which re-parses the template and
+    re-validates its variables on every invocation.
+    """
+    from langchain_core.messages import HumanMessage
+
+    return [
+        _system_message(),
+        HumanMessage(content=USER_PROMPT_TEMPLATE.format_map(payload)),
+    ]
+
+
+def _character_cache_key(characters: list) -> tuple:
+    """Build a hashable content key for a character list."""
+    return tuple(
+        (c.name, c.role, c.description, c.motivations, c.relationships, c.backstory)
+        for c in characters
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _format_characters_cached(key: tuple) -> str:
+    """Render the characters prompt block for a content key, caching per cast."""
+    return "\n".join(
+        _CHAR_TEMPLATE.format(
+            name=name,
+            role=role,
+            description=description,
+            motivations=motivations,
+            relationships=relationships,
+            backstory=backstory,
+        )
+        for name, role, description, motivations, relationships, backstory in key
+    )
+
+
 class DefaultArchitect:
     """Default architect implementation using Claude Sonnet.
 
     This architect generates story structures iteratively, building each plot event
-    with context from previous events to maintain narrative continuity.
+    with context from previous events to maintain narrative continuity. Because the
+    work is LLM-latency bound, the default mode drafts all plot events concurrently
+    and then refines each one with the context of the drafted events, trading one
+    extra LLM round for an ~Nx reduction in serial latency. Set ``parallel=False``
+    to fall back to the strictly sequential loop.
     """
 
     name = "default"
 
+    def __init__(self):
+        self._model_name = "claude-sonnet-4-20250514"
+        self._chain = None
+        self._fused_chain = None
+
     def generate(
         self,
         input: ArchitectInput,
         tools: ToolRegistry | None = None,
+        parallel: bool = True,
     ) -> StoryArchitecture:
         """Generate a complete story architecture with plot events and beats.
 
         Args:
             input: The architect input parameters.
             tools: Optional tool registry (not used by default architect).
+            parallel: If True, draft all plot events concurrently and refine them
+                      in a second pass. If False, generate events one at a time,
+                      each with full context from the events before it.
 
         Returns:
             A complete story architecture.
         """
-        chain = self._create_chain()
-        plot_events: list[PlotEvent] = []
-        characters_text = self._format_characters(input.characters)
-        min_beats, max_beats = input.beats_per_event
+        if parallel:
+            if input.num_plot_events <= FUSE_THRESHOLD:
+                return self._generate_fused(input)
+            return asyncio.run(self.agenerate(input, tools=tools))
 
-        for i in range(input.num_plot_events):
-            current_event = i + 1
-            previous_events_section = self._format_previous_events(plot_events)
+        return StoryArchitecture(
+            plot_events=list(self.stream_events(input, tools=tools))
+        )
+
+    def _generate_fused(self, input: ArchitectInput) -> StoryArchitecture:
+        """Generate the full architecture in a single structured LLM call.
 
-            result = chain.invoke(
+        For short stories the per-event round trips dominate wall time, so
+        one fused request for the whole StoryArchitecture removes all but one
+        time-to-first-token cycle at the cost of no event-by-event context
+        feeding (the model sees the whole task at once instead).
+        """
+        chain = self._create_fused_chain()
+        min_beats, max_beats = input.beats_per_event
+
+        result = chain.invoke(
+            _build_fused_messages(
                 {
                     "story_idea": input.story_idea,
                     "tone": input.tone,
-                    "characters_text": characters_text,
-                    "current_event": current_event,
+                    "characters_text": self._format_characters(input.characters),
                     "total_events": input.num_plot_events,
                     "min_beats": min_beats,
                     "max_beats": max_beats,
-                    "previous_events_section": previous_events_section,
                 }
             )
+        )
 
-            log.info(
+        log.info(
+            "architecture_fused_complete",
+            architect=self.name,
+            total_events=input.num_plot_events,
+            plot_events=len(result.plot_events),
+        )
+        return result
+
+    def stream_events(
+        self,
+        input: ArchitectInput,
+        tools: ToolRegistry | None = None,
+    ) -> Iterator[PlotEvent]:
+        """Generate plot events sequentially, yielding each one as it completes.
+
+        Exposing the sequential loop as a generator lets downstream stages
+        (e.g., the narrator) start working on an event as soon as it is
+        finalized instead of blocking until the full architecture exists.
+
+        Args:
+            input: The architect input parameters.
+            tools: Optional tool registry (not used by default architect).
+
+        Yields:
+            Each completed plot event, in order.
+        """
+        chain = self._create_chain()
+        rendered_blocks: list[str] = []
+        characters_text = self._format_characters(input.characters)
+        min_beats, max_beats = input.beats_per_event
+        total_events = input.num_plot_events
+
+        # Bind the loop-invariant log context once so each iteration only
+        # contributes its two changing keys.
+        evt_log = log.bind(architect=self.name, total_events=total_events)
+
+        # Hoist loop-invariant attribute lookups to locals so the hot loop
+        # runs on LOAD_FAST instead of repeated LOAD_ATTR.
+        invoke = chain.invoke
+        join_blocks = self._join_event_blocks
+        render_block = self._render_event_block
+        append_block = rendered_blocks.append
+
+        # The invariant payload entries are frozen once; interning the big
+        # strings lets repeated dict builds reuse the same objects, and the
+        # per-iteration unpack is a C-level bulk copy plus two inserts.
+        invariant = MappingProxyType(
+            {
+                "story_idea": sys.intern(input.story_idea),
+                "tone": sys.intern(input.tone),
+                "characters_text": characters_text,
+                "total_events": total_events,
+                "min_beats": min_beats,
+                "max_beats": max_beats,
+            }
+        )
+
+        for current_event in range(1, total_events + 1):
+            payload = {
+                **invariant,
+                "current_event": current_event,
+                "previous_events_section": join_blocks(rendered_blocks),
+            }
+
+            result = invoke(_build_messages(payload))
+
+            evt_log.info(
                 "plot_event_complete",
-                architect=self.name,
                 plot_event=current_event,
-                total_events=input.num_plot_events,
                 beats=len(result.beats),
             )
-            plot_events.append(result)
+            yield result
+            append_block(render_block(result, current_event))
 
-        return StoryArchitecture(plot_events=plot_events)
+    def generate_many(
+        self,
+        inputs: list[ArchitectInput],
+        tools: ToolRegistry | None = None,
+        max_concurrency: int = 8,
+    ) -> list[StoryArchitecture]:
+        """Generate architectures for several inputs concurrently.
 
-    def _create_chain(self):
-        """Create the LangChain chain for generating plot events."""
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514")
-        structured_llm = llm.with_structured_output(PlotEvent)
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", SYSTEM_PROMPT),
-                ("user", USER_PROMPT_TEMPLATE),
+        Events are produced round by round: event k for every run still in
+        progress goes out as one chain.batch call, so the LLM pipeline stays
+        full across runs while each run keeps full sequential context from
+        its own previous events.
+
+        Args:
+            inputs: The architect inputs to generate architectures for.
+            tools: Optional tool registry (not used by default architect).
+            max_concurrency: Upper bound on concurrent LLM requests per round.
+
+        Returns:
+            One story architecture per input, in input order.
+        """
+        chain = self._create_chain()
+
+        payloads: list[dict] = []
+        events_per_run: list[list[PlotEvent]] = []
+        blocks_per_run: list[list[str]] = []
+        for inp in inputs:
+            min_beats, max_beats = inp.beats_per_event
+            payloads.append(
+                {
+                    "story_idea": inp.story_idea,
+                    "tone": inp.tone,
+                    "characters_text": self._format_characters(inp.characters),
+                    "current_event": 0,
+                    "total_events": inp.num_plot_events,
+                    "min_beats": min_beats,
+                    "max_beats": max_beats,
+                    "previous_events_section": "",
+                }
+            )
+            events_per_run.append([])
+            blocks_per_run.append([])
+
+        max_events = max((inp.num_plot_events for inp in inputs), default=0)
+        for event_idx in range(max_events):
+            current_event = event_idx + 1
+            active = [
+                i
+                for i, inp in enumerate(inputs)
+                if event_idx < inp.num_plot_events
             ]
+
+            batch = []
+            for i in active:
+                payload = payloads[i]
+                payload["current_event"] = current_event
+                payload["previous_events_section"] = self._join_event_blocks(
+                    blocks_per_run[i]
+                )
+                batch.append(_build_messages(payload))
+
+            results = chain.batch(
+                batch, config={"max_concurrency": min(len(batch), max_concurrency)}
+            )
+            for i, result in zip(active, results):
+                events_per_run[i].append(result)
+                blocks_per_run[i].append(
+                    self._render_event_block(result, current_event)
+                )
+
+            log.info(
+                "plot_event_round_complete",
+                architect=self.name,
+                plot_event=current_event,
+                active_runs=len(active),
+                total_runs=len(inputs),
+            )
+
+        return [StoryArchitecture(plot_events=events) for events in events_per_run]
+
+    async def agenerate(
+        self,
+        input: ArchitectInput,
+        tools: ToolRegistry | None = None,
+        refine: bool = True,
+    ) -> StoryArchitecture:
+        """Generate a story architecture using batched draft-then-refine passes.
+
+        All plot-event prompts are issued as a single batch with a shared
+        placeholder for the previous-events context, then a second batched pass
+        refines each event against the drafted events before it.
+
+        Args:
+            input: The architect input parameters.
+            tools: Optional tool registry (not used by default architect).
+            refine: If True, run the second refinement pass with real context.
+
+        Returns:
+            A complete story architecture.
+        """
+        chain = self._create_chain()
+        characters_text = self._format_characters(input.characters)
+        min_beats, max_beats = input.beats_per_event
+
+        def build_payload(current_event: int, previous_events_section: str) -> dict:
+            return {
+                "story_idea": input.story_idea,
+                "tone": input.tone,
+                "characters_text": characters_text,
+                "current_event": current_event,
+                "total_events": input.num_plot_events,
+                "min_beats": min_beats,
+                "max_beats": max_beats,
+                "previous_events_section": previous_events_section,
+            }
+
+        draft_payloads = [
+            _build_messages(build_payload(i + 1, DRAFT_PREVIOUS_EVENTS_SECTION))
+            for i in range(input.num_plot_events)
+        ]
+        config = {"max_concurrency": input.num_plot_events}
+        drafts = await chain.abatch(draft_payloads, config=config)
+        log.info(
+            "plot_events_drafted",
+            architect=self.name,
+            total_events=input.num_plot_events,
+        )
+
+        if not refine:
+            return StoryArchitecture(plot_events=drafts)
+
+        draft_blocks = [
+            self._render_event_block(draft, i + 1) for i, draft in enumerate(drafts)
+        ]
+        refine_payloads = [
+            _build_messages(
+                build_payload(i + 1, self._join_event_blocks(draft_blocks[:i]))
+            )
+            for i in range(input.num_plot_events)
+        ]
+        plot_events = await chain.abatch(refine_payloads, config=config)
+        log.info(
+            "plot_events_refined",
+            architect=self.name,
+            total_events=input.num_plot_events,
         )
 
-        return prompt | structured_llm
+        return StoryArchitecture(plot_events=plot_events)
+
+    def _create_chain(self):
+        """Return the structured LLM for generating plot events, building it once.
+
+        Constructing ChatAnthropic and binding the PlotEvent schema are expensive
+        relative to a single call, so the runnable is cached on the instance.
+        Prompt rendering happens up front in _build_messages, so no prompt
+        template is piped in here.
+        """
+        if self._chain is None:
+            llm = get_chat_anthropic(self._model_name)
+            self._chain = (
+                llm.with_structured_output(_plot_event_tool())
+                | PlotEvent.model_validate
+            )
+        return self._chain
+
+    def _create_fused_chain(self):
+        """Return the structured LLM for whole-architecture generation."""
+        if self._fused_chain is None:
+            llm = get_chat_anthropic(self._model_name)
+            self._fused_chain = (
+                llm.with_structured_output(_story_architecture_tool())
+                | StoryArchitecture.model_validate
+            )
+        return self._fused_chain
 
     def _format_characters(self, characters: list) -> str:
-        """Format character profiles for the prompt."""
-        lines = []
-        for char in characters:
-            lines.append(f"### {char.name} ({char.role})")
-            lines.append(f"**Description:** {char.description}")
-            lines.append(f"**Motivations:** {char.motivations}")
-            lines.append(f"**Relationships:** {char.relationships}")
-            lines.append(f"**Backstory:** {char.backstory}")
-            lines.append("")
-        return "\n".join(lines)
+        """Format character profiles for the prompt.
+
+        The rendered block is cached process-wide by content, so repeated runs
+        with the same cast skip the formatting entirely.
+        """
+        return _format_characters_cached(_character_cache_key(characters))
 
     def _format_previous_events(self, events: list[PlotEvent]) -> str:
         """Format previously generated plot events for context."""
-        if not events:
-            return "**Previous Plot Events:** None (this is the first event)"
+        return self._join_event_blocks(
+            [self._render_event_block(event, i) for i, event in enumerate(events, 1)]
+        )
 
-        lines = ["**Previous Plot Events:**\n"]
-        for i, event in enumerate(events, 1):
-            lines.append(f"### Event {i}: {event.title}")
-            lines.append(f"{event.summary}")
-            lines.append("\nBeats:")
-            for beat in event.beats:
-                chars = (
-                    ", ".join(beat.characters_involved)
-                    if beat.characters_involved
-                    else "None"
-                )
-                lines.append(
-                    f"- [{beat.beat_type}] {beat.description} (Characters: {chars})"
-                )
-            lines.append("")
-        return "\n".join(lines)
+    def _render_event_block(self, event: PlotEvent, index: int) -> str:
+        """Render the context block for a single plot event.
+
+        The event body is serialized with pydantic-core's compiled JSON
+        serializer rather than walking every beat's fields in Python, so
+        rendering is a single call per event regardless of beat count.
+        Events are append-only during generation, so each event is rendered
+        exactly once and the blocks are joined incrementally rather than
+        re-formatting the whole history every iteration.
+        """
+        return (
+            f"### Event {index}: {event.title}\n"
+            f"```json\n{event.model_dump_json()}\n```\n"
+        )
+
+    def _join_event_blocks(self, blocks: list[str]) -> str:
+        """Join pre-rendered event blocks into the previous-events section."""
+        if not blocks:
+            return "**Previous Plot Events:** None (this is the first event)"
+        return "**Previous Plot Events:**\n\n" + "\n".join(blocks)
@@ -6,12 +6,13 @@ agent implementations.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import structlog
-from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 
+from agents._llm import get_chat_anthropic
 from agents.character.protocols import (
     AnswerInput,
     CharacterResponse,
@@ -28,20 +29,96 @@ if TYPE_CHECKING:
 log = structlog.get_logger(__name__)
 
 
+def freeze_schema(schema: dict) -> MappingProxyType:
+    """Wrap a schema dict (and its nested dicts) in read-only proxies.
+
+    Frozen schemas can be shared by identity: callers inspecting the schema
+    never need a defensive copy, and mutation attempts fail loudly instead
+    of silently corrupting the shared module-level definition.
+
+    Args:
+        schema: A JSON-Schema-style dict.
+
+    Returns:
+        A read-only view over the schema with all nested dicts frozen.
+    """
+    return MappingProxyType(
+        {
+            key: freeze_schema(value) if isinstance(value, dict) else value
+            for key, value in schema.items()
+        }
+    )
+
+
+def compile_property_validator(schema: dict):
+    """Compile a declarative property schema into a fast validation callable.
+
+    The allowed-key set and numeric bounds are extracted once at compile
+    time, so each validation is a set difference plus range checks rather
+    than a walk of the schema dict.
+
+    Args:
+        schema: A JSON-Schema-style dict with numeric "properties" entries.
+
+    Returns:
+        A callable that validates a properties dict, raising ValueError on
+        unknown keys or out-of-range values.
+    """
+    bounds = {
+        name: (spec.get("minimum", 0), spec.get("maximum", 100))
+        for name, spec in schema["properties"].items()
+    }
+    allowed = frozenset(bounds)
+
+    def validate(properties: dict) -> None:
+        unknown = properties.keys() - allowed
+        if unknown:
+            available = ", ".join(sorted(allowed))
+            raise ValueError(
+                f"Unknown properties: {sorted(unknown)}. Available: {available}"
+            )
+        for name in properties:
+            value = properties[name]
+            minimum, maximum = bounds[name]
+            if not isinstance(value, (int, float)) or not (
+                minimum <= value <= maximum
+            ):
+                raise ValueError(
+                    f"Property '{name}' must be a number between "
+                    f"{minimum} and {maximum}, got {value!r}"
+                )
+
+    return validate
+
+
 class BaseCharacterAgent:
     """Base implementation for character agents.
 
     Provides common functionality including LLM interaction and memory
     management. Subclasses should customize the personality description
     generation and system prompts.
+
+    Attributes are slotted (subclasses declare their own additions), which
+    trims per-instance memory for large casts and speeds up attribute
+    access. ``personality_description`` has a slot here even when a
+    subclass fills it lazily on first access.
     """
 
+    __slots__ = (
+        "character_id",
+        "profile",
+        "personality_description",
+        "instructions",
+        "memory",
+        "_llm",
+    )
+
     def __init__(
         self,
         character_id: str,
         character_profile: "CharacterProfile",
-        personality_description: str,
-        instructions: str,
+        personality_description: str | None = None,
+        instructions: str = "",
         initial_memory: CharacterMemory | None = None,
     ):
         """Initialize the character agent.
@@ -50,17 +127,20 @@ class BaseCharacterAgent:
             character_id: Unique identifier for this character.
             character_profile: The character's profile.
             personality_description: Description of personality traits
-                                     generated by the agent type.
+                                     generated by the agent type, or None when
+                                     the subclass provides it lazily (e.g.,
+                                     via a cached property).
             instructions: Custom behavioral instructions.
             initial_memory: Optional existing memory to restore.
         """
         self.character_id = character_id
         self.profile = character_profile
-        self.personality_description = personality_description
+        if personality_description is not None:
+            self.personality_description = personality_description
         self.instructions = instructions
         self.memory = initial_memory or CharacterMemory()
 
-        self._llm = ChatAnthropic(model="claude-sonnet-4-20250514")
+        self._llm = get_chat_anthropic("claude-sonnet-4-20250514")
 
     def _build_base_system_prompt(self) -> str:
         """Build the base system prompt for this character.
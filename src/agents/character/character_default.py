@@ -6,15 +6,25 @@ like assertiveness, warmth, formality, verbosity, and emotionality.
 
 from __future__ import annotations
 
+import functools
+import math
+import sys
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from agents.character.base import BaseCharacterAgent
+from agents.character.base import (
+    BaseCharacterAgent,
+    compile_property_validator,
+    freeze_schema,
+)
 
 if TYPE_CHECKING:
     from models import CharacterMemory, CharacterProfile
 
 
-DEFAULT_PROPERTY_SCHEMA: dict[str, Any] = {
+DEFAULT_PROPERTY_SCHEMA: Mapping[str, Any] = freeze_schema({
     "type": "object",
     "properties": {
         "assertiveness": {
@@ -54,6 +64,86 @@ DEFAULT_PROPERTY_SCHEMA: dict[str, Any] = {
         },
     },
     "additionalProperties": False,
+})
+
+
+# Compiled once at import; validates trait dicts against the schema above
+# without re-walking the schema per call.
+_validate_properties = compile_property_validator(DEFAULT_PROPERTY_SCHEMA)
+
+
+_DEFAULT_PROPERTIES = MappingProxyType(
+    {
+        "assertiveness": 50,
+        "warmth": 50,
+        "formality": 50,
+        "verbosity": 50,
+        "emotionality": 50,
+    }
+)
+
+
+# Trait and level names are interned so the repeated dict lookups below
+# resolve on pointer equality instead of full string hash+compare.
+_TRAIT_NAMES = tuple(
+    sys.intern(n)
+    for n in ("assertiveness", "warmth", "formality", "verbosity", "emotionality")
+)
+
+_LEVELS = tuple(
+    sys.intern(level) for level in ("very low", "low", "moderate", "high", "very high")
+)
+
+# C-implemented bulk extractor for the five trait values, in _TRAIT_NAMES
+# order; used on dicts pre-filled with defaults so every key is present.
+_TRAIT_GETTER = itemgetter(*_TRAIT_NAMES)
+
+
+_TRAIT_DESCRIPTIONS: dict[str, dict[str, str]] = {
+    "assertiveness": {
+        "very low": "passive, deferential, avoids confrontation",
+        "low": "generally yielding, prefers others to lead",
+        "moderate": "balanced, assertive when needed but flexible",
+        "high": "confident, takes initiative, speaks their mind",
+        "very high": "dominant, forceful, commands attention",
+    },
+    "warmth": {
+        "very low": "cold, distant, uncomfortable with emotional connection",
+        "low": "reserved, maintains professional distance",
+        "moderate": "friendly but measured, appropriate warmth",
+        "high": "warm, caring, easily connects with others",
+        "very high": "extremely warm, nurturing, emotionally open",
+    },
+    "formality": {
+        "very low": "very casual, relaxed speech, ignores conventions",
+        "low": "informal, uses colloquialisms freely",
+        "moderate": "adapts formality to context",
+        "high": "formal, proper, respects conventions",
+        "very high": "very formal, precise language, highly proper",
+    },
+    "verbosity": {
+        "very low": "terse, minimal words, gets straight to point",
+        "low": "concise, economical with words",
+        "moderate": "balanced, says what needs to be said",
+        "high": "talkative, elaborates on points",
+        "very high": "verbose, detailed, extensive explanations",
+    },
+    "emotionality": {
+        "very low": "stoic, rarely shows emotion, controlled",
+        "low": "reserved emotionally, subtle expressions",
+        "moderate": "appropriate emotional expression",
+        "high": "emotionally expressive, feelings evident",
+        "very high": "highly emotional, wears heart on sleeve",
+    },
+}
+
+# Flattened lookup table: trait name -> 5-tuple of descriptions indexed by
+# bucket, in _LEVELS order. One dict lookup plus a tuple index replaces the
+# level-name hop through the nested dicts above. Keys are interned to match
+# the interned constants used by callers.
+_TRAIT_TABLE = {
+    sys.intern(name): tuple(levels[level] for level in _LEVELS)
+    for name, levels in _TRAIT_DESCRIPTIONS.items()
 }
 
 
@@ -61,91 +151,77 @@ def _describe_trait(name: str, value: int) -> str:
     """Generate a description for a trait value.
 
     Args:
-        name: The trait name.
+        name: The trait name (must be one of the schema traits).
         value: The trait value (0-100).
 
     Returns:
         A descriptive string for this trait level.
     """
-    if value <= 20:
-        level = "very low"
-    elif value <= 40:
-        level = "low"
-    elif value <= 60:
-        level = "moderate"
-    elif value <= 80:
-        level = "high"
-    else:
-        level = "very high"
-
-    trait_descriptions = {
-        "assertiveness": {
-            "very low": "passive, deferential, avoids confrontation",
-            "low": "generally yielding, prefers others to lead",
-            "moderate": "balanced, assertive when needed but flexible",
-            "high": "confident, takes initiative, speaks their mind",
-            "very high": "dominant, forceful, commands attention",
-        },
-        "warmth": {
-            "very low": "cold, distant, uncomfortable with emotional connection",
-            "low": "reserved, maintains professional distance",
-            "moderate": "friendly but measured, appropriate warmth",
-            "high": "warm, caring, easily connects with others",
-            "very high": "extremely warm, nurturing, emotionally open",
-        },
-        "formality": {
-            "very low": "very casual, relaxed speech, ignores conventions",
-            "low": "informal, uses colloquialisms freely",
-            "moderate": "adapts formality to context",
-            "high": "formal, proper, respects conventions",
-            "very high": "very formal, precise language, highly proper",
-        },
-        "verbosity": {
-            "very low": "terse, minimal words, gets straight to point",
-            "low": "concise, economical with words",
-            "moderate": "balanced, says what needs to be said",
-            "high": "talkative, elaborates on points",
-            "very high": "verbose, detailed, extensive explanations",
-        },
-        "emotionality": {
-            "very low": "stoic, rarely shows emotion, controlled",
-            "low": "reserved emotionally, subtle expressions",
-            "moderate": "appropriate emotional expression",
-            "high": "emotionally expressive, feelings evident",
-            "very high": "highly emotional, wears heart on sleeve",
-        },
-    }
-
-    return trait_descriptions.get(name, {}).get(level, f"{level} {name}")
+    # Branchless bucket pick: ceil(value) - 1 floor-divided by the 20-point
+    # band width lands in the same bucket as the old <=20/<=40/... ladder.
+    return _TRAIT_TABLE[name][min(max(math.ceil(value) - 1, 0) // 20, 4)]
+
+
+# The description has a fixed shape, so the whole layout is prebuilt once at
+# import; each generation is then a single format call instead of building and
+# joining a list of lines.
+_DESCRIPTION_TEMPLATE = "This character's personality traits:\n" + "\n".join(
+    f"- **{name.title()}** ({{{name}}}/100): {{{name}_desc}}" for name in _TRAIT_NAMES
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_personality_description_cached(
+    assertiveness: int,
+    warmth: int,
+    formality: int,
+    verbosity: int,
+    emotionality: int,
+) -> str:
+    """Build the personality description for one combination of trait values."""
+    return _DESCRIPTION_TEMPLATE.format(
+        assertiveness=assertiveness,
+        assertiveness_desc=_describe_trait("assertiveness", assertiveness),
+        warmth=warmth,
+        warmth_desc=_describe_trait("warmth", warmth),
+        formality=formality,
+        formality_desc=_describe_trait("formality", formality),
+        verbosity=verbosity,
+        verbosity_desc=_describe_trait("verbosity", verbosity),
+        emotionality=emotionality,
+        emotionality_desc=_describe_trait("emotionality", emotionality),
+    )
 
 
 def _generate_personality_description(properties: dict[str, Any]) -> str:
     """Generate a personality description from trait values.
 
+    The description is pure over the trait values, so results are memoized;
+    casts sharing trait combinations (including the common all-defaults case)
+    pay the string-building cost once per process.
+
     Args:
         properties: Dictionary of trait names to values.
 
     Returns:
         A formatted personality description string.
     """
-    lines = ["This character's personality traits:"]
-
-    for trait in ["assertiveness", "warmth", "formality", "verbosity", "emotionality"]:
-        value = properties.get(trait, 50)
-        description = _describe_trait(trait, value)
-        lines.append(f"- **{trait.title()}** ({value}/100): {description}")
-
-    return "\n".join(lines)
+    # One C-level merge plus one itemgetter call replaces five .get calls;
+    # map(int) normalizes values so float/int duplicates share a cache slot.
+    merged = {**_DEFAULT_PROPERTIES, **properties}
+    return _generate_personality_description_cached(*map(int, _TRAIT_GETTER(merged)))
 
 
 class DefaultCharacterAgent(BaseCharacterAgent):
     """A character agent using simple trait-based personality."""
 
+    __slots__ = ("properties",)
+
     def __init__(
         self,
         character_id: str,
         character_profile: "CharacterProfile",
-        properties: dict[str, Any],
+        properties: Mapping[str, Any],
         instructions: str,
         initial_memory: "CharacterMemory | None" = None,
     ):
@@ -158,18 +234,29 @@ class DefaultCharacterAgent(BaseCharacterAgent):
             instructions: Custom behavioral instructions.
             initial_memory: Optional existing memory to restore.
         """
-        personality_description = _generate_personality_description(properties)
-
         super().__init__(
             character_id=character_id,
             character_profile=character_profile,
-            personality_description=personality_description,
             instructions=instructions,
             initial_memory=initial_memory,
         )
 
         self.properties = properties
 
+    def __getattr__(self, name: str) -> str:
+        # Lazily fill the personality_description slot on first access so
+        # agents created in bulk (or restored from memory) that never render
+        # a prompt skip the string-building cost entirely. Slotted classes
+        # can't use functools.cached_property (no __dict__); an unset slot
+        # raises AttributeError, which routes here exactly once.
+        if name == "personality_description":
+            description = _generate_personality_description(self.properties)
+            self.personality_description = description
+            return description
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
 
 class DefaultCharacterAgentType:
     """Factory for creating default trait-based character agents."""
@@ -177,7 +264,7 @@ class DefaultCharacterAgentType:
     name = "default"
 
     @property
-    def property_schema(self) -> dict[str, Any]:
+    def property_schema(self) -> Mapping[str, Any]:
         """JSON Schema for default character agent properties.
 
         Returns:
@@ -189,7 +276,7 @@ class DefaultCharacterAgentType:
         self,
         character_id: str,
         character_profile: "CharacterProfile",
-        type_properties: dict[str, Any],
+        type_properties: Mapping[str, Any],
         instructions: str,
         initial_memory: "CharacterMemory | None" = None,
     ) -> DefaultCharacterAgent:
@@ -204,15 +291,27 @@ class DefaultCharacterAgentType:
 
         Returns:
             A configured DefaultCharacterAgent instance.
+
+        Raises:
+            ValueError: If type_properties contains unknown traits or
+                        out-of-range values.
         """
-        # Apply defaults for missing traits
-        properties = {
-            "assertiveness": type_properties.get("assertiveness", 50),
-            "warmth": type_properties.get("warmth", 50),
-            "formality": type_properties.get("formality", 50),
-            "verbosity": type_properties.get("verbosity", 50),
-            "emotionality": type_properties.get("emotionality", 50),
-        }
+        _validate_properties(type_properties)
+
+        # All-defaults casts are common; reuse the frozen defaults mapping so
+        # every such agent shares one dict and the memoized description.
+        if not type_properties:
+            properties: Mapping[str, Any] = _DEFAULT_PROPERTIES
+        else:
+            # Apply defaults for missing traits in one C-level merge, keeping
+            # only the known trait keys from the caller's dict.
+            properties = {
+                **_DEFAULT_PROPERTIES,
+                **{
+                    k: type_properties[k]
+                    for k in _DEFAULT_PROPERTIES.keys() & type_properties.keys()
+                },
+            }
 
         return DefaultCharacterAgent(
             character_id=character_id,
@@ -7,15 +7,25 @@ Thinking/Feeling, and Judging/Perceiving.
 
 from __future__ import annotations
 
+import bisect
+import functools
+import sys
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from agents.character.base import BaseCharacterAgent
+from agents.character.base import (
+    BaseCharacterAgent,
+    compile_property_validator,
+    freeze_schema,
+)
 
 if TYPE_CHECKING:
     from models import CharacterMemory, CharacterProfile
 
 
-MBTI_PROPERTY_SCHEMA: dict[str, Any] = {
+MBTI_PROPERTY_SCHEMA: Mapping[str, Any] = freeze_schema({
     "type": "object",
     "properties": {
         "extroversion": {
@@ -48,147 +58,189 @@ MBTI_PROPERTY_SCHEMA: dict[str, Any] = {
         },
     },
     "additionalProperties": False,
-}
+})
 
 
-def _get_mbti_type(properties: dict[str, Any]) -> str:
-    """Derive the 4-letter MBTI type from property values.
+# Compiled once at import; validates dimension dicts against the schema
+# above without re-walking the schema per call.
+_validate_properties = compile_property_validator(MBTI_PROPERTY_SCHEMA)
 
-    Args:
-        properties: Dictionary of MBTI dimension values.
 
-    Returns:
-        A 4-letter MBTI type string (e.g., "INTJ").
-    """
-    e_i = "E" if properties.get("extroversion", 50) >= 50 else "I"
-    n_s = "N" if properties.get("intuition", 50) >= 50 else "S"
-    t_f = "T" if properties.get("thinking", 50) >= 50 else "F"
-    j_p = "J" if properties.get("judging", 50) >= 50 else "P"
-    return f"{e_i}{n_s}{t_f}{j_p}"
+# Dimension names are interned so the repeated dict lookups in the hot
+# creation path resolve on pointer equality instead of hash+compare.
+_DIMENSION_NAMES = tuple(
+    sys.intern(n) for n in ("extroversion", "intuition", "thinking", "judging")
+)
 
+_DEFAULT_PROPERTIES = MappingProxyType(dict.fromkeys(_DIMENSION_NAMES, 50))
 
-def _describe_ei_dimension(value: int) -> str:
-    """Describe the Extroversion/Introversion dimension.
+# C-implemented bulk extractor for the four dimension values, in
+# _DIMENSION_NAMES order; used on dicts pre-filled with defaults so every
+# key is present.
+_DIMENSION_GETTER = itemgetter(*_DIMENSION_NAMES)
 
-    Args:
-        value: The dimension value (0-100).
 
-    Returns:
-        A description of how this dimension manifests.
-    """
-    if value <= 25:
-        return "Strongly introverted - deeply reflective, needs extensive alone time to recharge, prefers one-on-one interactions, thinks before speaking"
-    elif value <= 45:
-        return "Introverted - prefers smaller groups, values depth over breadth in relationships, processes internally before expressing"
-    elif value <= 55:
-        return "Balanced on the E/I spectrum - can adapt to both social and solitary situations, flexible in energy management"
-    elif value <= 75:
-        return "Extroverted - energized by social interaction, thinks out loud, comfortable in groups, seeks external stimulation"
-    else:
-        return "Strongly extroverted - thrives in social settings, very outgoing, processes through conversation, may struggle with extended solitude"
+# All 16 MBTI type strings, indexed by a 4-bit pattern of the dimension
+# threshold tests (bit set = first letter of the E/I, N/S, T/F, J/P pair).
+_MBTI_TYPES = tuple(
+    ("I", "E")[e] + ("S", "N")[n] + ("F", "T")[t] + ("P", "J")[j]
+    for e in (0, 1)
+    for n in (0, 1)
+    for t in (0, 1)
+    for j in (0, 1)
+)
 
 
-def _describe_ns_dimension(value: int) -> str:
-    """Describe the Intuition/Sensing dimension.
+def _get_mbti_type(properties: dict[str, Any]) -> str:
+    """Derive the 4-letter MBTI type from property values.
 
     Args:
-        value: The dimension value (0-100).
+        properties: Dictionary of MBTI dimension values.
 
     Returns:
-        A description of how this dimension manifests.
+        A 4-letter MBTI type string (e.g., "INTJ").
     """
-    if value <= 25:
-        return "Strongly sensing - focuses on concrete facts and present reality, trusts experience over theory, practical and detail-oriented"
-    elif value <= 45:
-        return "Sensing preference - values tangible evidence, prefers proven methods, attentive to sensory details"
-    elif value <= 55:
-        return "Balanced on the N/S spectrum - can appreciate both big picture and details, flexible in information gathering"
-    elif value <= 75:
-        return "Intuitive - focuses on patterns and possibilities, interested in meaning and future potential, comfortable with abstract concepts"
-    else:
-        return "Strongly intuitive - sees connections others miss, drawn to theory and innovation, may overlook practical details"
-
-
-def _describe_tf_dimension(value: int) -> str:
-    """Describe the Thinking/Feeling dimension.
+    index = (
+        ((properties.get("extroversion", 50) >= 50) << 3)
+        | ((properties.get("intuition", 50) >= 50) << 2)
+        | ((properties.get("thinking", 50) >= 50) << 1)
+        | (properties.get("judging", 50) >= 50)
+    )
+    return _MBTI_TYPES[index]
+
+
+# Shared bucket boundaries for all four dimensions; bisect_left over these
+# picks the same bucket as the old <=25/<=45/<=55/<=75 ladders.
+_DIMENSION_CUTOFFS = (25, 45, 55, 75)
+
+_EI_DESCRIPTIONS = (
+    "Strongly introverted - deeply reflective, needs extensive alone time to recharge, prefers one-on-one interactions, thinks before speaking",
+    "Introverted - prefers smaller groups, values depth over breadth in relationships, processes internally before expressing",
+    "Balanced on the E/I spectrum - can adapt to both social and solitary situations, flexible in energy management",
+    "Extroverted - energized by social interaction, thinks out loud, comfortable in groups, seeks external stimulation",
+    "Strongly extroverted - thrives in social settings, very outgoing, processes through conversation, may struggle with extended solitude",
+)
+
+_NS_DESCRIPTIONS = (
+    "Strongly sensing - focuses on concrete facts and present reality, trusts experience over theory, practical and detail-oriented",
+    "Sensing preference - values tangible evidence, prefers proven methods, attentive to sensory details",
+    "Balanced on the N/S spectrum - can appreciate both big picture and details, flexible in information gathering",
+    "Intuitive - focuses on patterns and possibilities, interested in meaning and future potential, comfortable with abstract concepts",
+    "Strongly intuitive - sees connections others miss, drawn to theory and innovation, may overlook practical details",
+)
+
+_TF_DESCRIPTIONS = (
+    "Strongly feeling - makes decisions based on values and impact on people, empathetic, seeks harmony, may prioritize relationships over logic",
+    "Feeling preference - considers emotional impact, values-driven, diplomatic, strives for consensus",
+    "Balanced on the T/F spectrum - can employ both logic and empathy, context-dependent decision making",
+    "Thinking preference - logical decision-making, values fairness and consistency, comfortable with objective critique",
+    "Strongly thinking - highly analytical, prioritizes logic over emotions, may seem detached or blunt",
+)
+
+_JP_DESCRIPTIONS = (
+    "Strongly perceiving - highly spontaneous and adaptable, dislikes rigid plans, keeps options open, may procrastinate on decisions",
+    "Perceiving preference - flexible approach, comfortable with ambiguity, responsive to new information",
+    "Balanced on the J/P spectrum - can be both structured and flexible depending on situation",
+    "Judging preference - prefers structure and plans, decisive, goal-oriented, likes closure",
+    "Strongly judging - highly organized and methodical, uncomfortable with uncertainty, prefers clear schedules and decisions",
+)
+
+
+def _describe_dimension(value: int, descriptions: tuple[str, ...]) -> str:
+    """Pick the description bucket for a dimension value.
 
     Args:
         value: The dimension value (0-100).
+        descriptions: The five bucket descriptions for this dimension.
 
     Returns:
         A description of how this dimension manifests.
     """
-    if value <= 25:
-        return "Strongly feeling - makes decisions based on values and impact on people, empathetic, seeks harmony, may prioritize relationships over logic"
-    elif value <= 45:
-        return "Feeling preference - considers emotional impact, values-driven, diplomatic, strives for consensus"
-    elif value <= 55:
-        return "Balanced on the T/F spectrum - can employ both logic and empathy, context-dependent decision making"
-    elif value <= 75:
-        return "Thinking preference - logical decision-making, values fairness and consistency, comfortable with objective critique"
-    else:
-        return "Strongly thinking - highly analytical, prioritizes logic over emotions, may seem detached or blunt"
+    return descriptions[bisect.bisect_left(_DIMENSION_CUTOFFS, value)]
+
+
+# The description has a fixed shape, so the whole layout is prebuilt once at
+# import; each generation is then a single format call instead of building and
+# joining a list of lines.
+_DESCRIPTION_TEMPLATE = (
+    "This character has an **{mbti_type}** personality type based on their MBTI dimensions:\n"
+    "\n"
+    "**Extroversion/Introversion** ({extroversion}/100):\n"
+    "{ei_desc}\n"
+    "\n"
+    "**Intuition/Sensing** ({intuition}/100):\n"
+    "{ns_desc}\n"
+    "\n"
+    "**Thinking/Feeling** ({thinking}/100):\n"
+    "{tf_desc}\n"
+    "\n"
+    "**Judging/Perceiving** ({judging}/100):\n"
+    "{jp_desc}"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_personality_description_cached(
+    extroversion: int,
+    intuition: int,
+    thinking: int,
+    judging: int,
+) -> tuple[str, str]:
+    """Build the description and MBTI type for one combination of dimensions."""
+    mbti_type = _get_mbti_type(
+        {
+            "extroversion": extroversion,
+            "intuition": intuition,
+            "thinking": thinking,
+            "judging": judging,
+        }
+    )
 
+    description = _DESCRIPTION_TEMPLATE.format(
+        mbti_type=mbti_type,
+        extroversion=extroversion,
+        ei_desc=_describe_dimension(extroversion, _EI_DESCRIPTIONS),
+        intuition=intuition,
+        ns_desc=_describe_dimension(intuition, _NS_DESCRIPTIONS),
+        thinking=thinking,
+        tf_desc=_describe_dimension(thinking, _TF_DESCRIPTIONS),
+        judging=judging,
+        jp_desc=_describe_dimension(judging, _JP_DESCRIPTIONS),
+    )
 
-def _describe_jp_dimension(value: int) -> str:
-    """Describe the Judging/Perceiving dimension.
+    return description, mbti_type
 
-    Args:
-        value: The dimension value (0-100).
 
-    Returns:
-        A description of how this dimension manifests.
-    """
-    if value <= 25:
-        return "Strongly perceiving - highly spontaneous and adaptable, dislikes rigid plans, keeps options open, may procrastinate on decisions"
-    elif value <= 45:
-        return "Perceiving preference - flexible approach, comfortable with ambiguity, responsive to new information"
-    elif value <= 55:
-        return "Balanced on the J/P spectrum - can be both structured and flexible depending on situation"
-    elif value <= 75:
-        return "Judging preference - prefers structure and plans, decisive, goal-oriented, likes closure"
-    else:
-        return "Strongly judging - highly organized and methodical, uncomfortable with uncertainty, prefers clear schedules and decisions"
-
-
-def _generate_personality_description(properties: dict[str, Any]) -> str:
+def _generate_personality_description(properties: dict[str, Any]) -> tuple[str, str]:
     """Generate a personality description from MBTI values.
 
+    The description is pure over the dimension values, so results are
+    memoized; repeated casts and restored sessions reuse the cached string.
+
     Args:
         properties: Dictionary of MBTI dimension values.
 
     Returns:
-        A formatted personality description string.
+        A tuple of (formatted personality description, 4-letter MBTI type).
     """
-    mbti_type = _get_mbti_type(properties)
-
-    lines = [
-        f"This character has an **{mbti_type}** personality type based on their MBTI dimensions:",
-        "",
-        f"**Extroversion/Introversion** ({properties.get('extroversion', 50)}/100):",
-        _describe_ei_dimension(properties.get("extroversion", 50)),
-        "",
-        f"**Intuition/Sensing** ({properties.get('intuition', 50)}/100):",
-        _describe_ns_dimension(properties.get("intuition", 50)),
-        "",
-        f"**Thinking/Feeling** ({properties.get('thinking', 50)}/100):",
-        _describe_tf_dimension(properties.get("thinking", 50)),
-        "",
-        f"**Judging/Perceiving** ({properties.get('judging', 50)}/100):",
-        _describe_jp_dimension(properties.get("judging", 50)),
-    ]
-
-    return "\n".join(lines)
+    # One C-level merge plus one itemgetter call replaces four .get calls;
+    # map(int) normalizes values so float/int duplicates share a cache slot.
+    merged = {**_DEFAULT_PROPERTIES, **properties}
+    return _generate_personality_description_cached(
+        *map(int, _DIMENSION_GETTER(merged))
+    )
 
 
 class MBTICharacterAgent(BaseCharacterAgent):
     """A character agent using MBTI-based personality."""
 
+    __slots__ = ("properties", "mbti_type")
+
     def __init__(
         self,
         character_id: str,
         character_profile: "CharacterProfile",
-        properties: dict[str, Any],
+        properties: Mapping[str, Any],
         instructions: str,
         initial_memory: "CharacterMemory | None" = None,
     ):
@@ -201,7 +253,9 @@ class MBTICharacterAgent(BaseCharacterAgent):
             instructions: Custom behavioral instructions.
             initial_memory: Optional existing memory to restore.
         """
-        personality_description = _generate_personality_description(properties)
+        personality_description, mbti_type = _generate_personality_description(
+            properties
+        )
 
         super().__init__(
             character_id=character_id,
@@ -212,7 +266,7 @@ class MBTICharacterAgent(BaseCharacterAgent):
         )
 
         self.properties = properties
-        self.mbti_type = _get_mbti_type(properties)
+        self.mbti_type = mbti_type
 
 
 class MBTICharacterAgentType:
@@ -221,7 +275,7 @@ class MBTICharacterAgentType:
     name = "mbti"
 
     @property
-    def property_schema(self) -> dict[str, Any]:
+    def property_schema(self) -> Mapping[str, Any]:
         """JSON Schema for MBTI character agent properties.
 
         Returns:
@@ -233,7 +287,7 @@ class MBTICharacterAgentType:
         self,
         character_id: str,
         character_profile: "CharacterProfile",
-        type_properties: dict[str, Any],
+        type_properties: Mapping[str, Any],
         instructions: str,
         initial_memory: "CharacterMemory | None" = None,
     ) -> MBTICharacterAgent:
@@ -248,14 +302,27 @@ class MBTICharacterAgentType:
 
         Returns:
             A configured MBTICharacterAgent instance.
+
+        Raises:
+            ValueError: If type_properties contains unknown dimensions or
+                        out-of-range values.
         """
-        # Apply defaults for missing dimensions
-        properties = {
-            "extroversion": type_properties.get("extroversion", 50),
-            "intuition": type_properties.get("intuition", 50),
-            "thinking": type_properties.get("thinking", 50),
-            "judging": type_properties.get("judging", 50),
-        }
+        _validate_properties(type_properties)
+
+        # All-defaults casts are common; reuse the frozen defaults mapping so
+        # every such agent shares one dict and the memoized description.
+        if not type_properties:
+            properties: Mapping[str, Any] = _DEFAULT_PROPERTIES
+        else:
+            # Apply defaults for missing dimensions in one C-level merge, keeping
+            # only the known dimension keys from the caller's dict.
+            properties = {
+                **_DEFAULT_PROPERTIES,
+                **{
+                    k: type_properties[k]
+                    for k in _DEFAULT_PROPERTIES.keys() & type_properties.keys()
+                },
+            }
 
         return MBTICharacterAgent(
             character_id=character_id,
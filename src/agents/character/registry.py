@@ -6,26 +6,57 @@ instances, their creation, and memory persistence across scenes.
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from pydantic import BaseModel
-
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from agents.character.protocols import CharacterAgent, CharacterAgentType
     from models import CharacterMemory, CharacterProfile
 
+    CharacterSpec = tuple[
+        str,  # character_id
+        str,  # type_name
+        CharacterProfile,
+        dict[str, Any],  # type properties
+        str,  # instructions
+        "CharacterMemory | None",
+    ]
+
 log = structlog.get_logger(__name__)
 
+# Level check for guarding debug emissions: when DEBUG is filtered out (the
+# production default), the guard skips structlog's kwarg binding entirely.
+# Checked at call time, not import time, so late logging configuration is
+# still honored.
+_stdlib_log = logging.getLogger(__name__)
+
 
-class CharacterRegistry(BaseModel):
+class CharacterRegistry:
     """Runtime registry managing character agent instances.
 
     The registry handles character agent creation, caching, and memory
-    persistence across scenes in a story generation session.
+    persistence across scenes in a story generation session. It is plain
+    runtime state — not a serialized model — so it deliberately avoids the
+    pydantic construction/validation machinery.
+
+    ``get_character(character_id)`` and ``has_character(character_id)`` are
+    bound directly to the underlying dict's ``__getitem__``/``__contains__``
+    in ``__init__``, keeping per-lookup dispatch cost minimal.
     """
 
+    __slots__ = (
+        "_agent_types",
+        "_characters",
+        "_sorted_types_cache",
+        "_character_ids_cache",
+        "get_character",
+        "has_character",
+    )
+
     def __init__(self, agent_types: dict[str, "CharacterAgentType"] | None = None):
         """Initialize the registry.
 
@@ -33,9 +64,24 @@ class CharacterRegistry(BaseModel):
             agent_types: Dictionary of available agent types. If None,
                          types will be discovered via entry points.
         """
-        self._agent_types = agent_types or {}
+        # Copy rather than alias: discovery hands out a process-shared
+        # read-only mapping, and register_agent_type mutates this dict.
+        self._agent_types = dict(agent_types) if agent_types else {}
         self._characters: dict[str, "CharacterAgent"] = {}
 
+        # Memoized list results, invalidated on registration/creation.
+        # Registries are read-heavy and write-rare, so polling callers
+        # (e.g. UI refreshes) get an O(1) copy instead of a fresh sort.
+        self._sorted_types_cache: tuple[str, ...] | None = None
+        self._character_ids_cache: tuple[str, ...] | None = None
+
+        # Bound-method aliases so hot lookups go straight to the dict
+        # without a Python-level wrapper frame. get_character raises
+        # KeyError for unknown IDs, has_character returns a bool —
+        # the same contracts the old wrapper methods had.
+        self.get_character = self._characters.__getitem__
+        self.has_character = self._characters.__contains__
+
     def register_agent_type(
         self,
         name: str,
@@ -48,7 +94,9 @@ class CharacterRegistry(BaseModel):
             agent_type: The agent type to register.
         """
         self._agent_types[name] = agent_type
-        log.debug("character_agent_type_registered", type_name=name)
+        self._sorted_types_cache = None
+        if _stdlib_log.isEnabledFor(logging.DEBUG):
+            log.debug("character_agent_type_registered", type_name=name)
 
     def create_character(
         self,
@@ -75,55 +123,65 @@ class CharacterRegistry(BaseModel):
         Raises:
             ValueError: If the specified agent type is not found.
         """
-        if type_name not in self._agent_types:
-            available = ", ".join(sorted(self._agent_types.keys())) or "(none)"
-            raise ValueError(
-                f"Unknown character agent type '{type_name}'. Available: {available}"
-            )
-
-        agent_type = self._agent_types[type_name]
-        character = agent_type.create_instance(
-            character_id=character_id,
-            character_profile=profile,
-            type_properties=properties,
-            instructions=instructions,
-            initial_memory=memory,
-        )
-
-        self._characters[character_id] = character
-        log.info(
-            "character_created",
-            character_id=character_id,
-            type_name=type_name,
-            has_prior_memory=memory is not None,
-        )
+        return self.create_characters(
+            [(character_id, type_name, profile, properties, instructions, memory)]
+        )[0]
 
-        return character
+    def create_characters(
+        self,
+        specs: "Sequence[CharacterSpec]",
+    ) -> list["CharacterAgent"]:
+        """Create and register several character agents in one pass.
 
-    def get_character(self, character_id: str) -> "CharacterAgent":
-        """Get a character agent by ID.
+        Loading a scene creates its whole cast at once; this amortizes the
+        per-character overhead by resolving each distinct agent type a single
+        time, inserting all agents with one dict.update, and emitting one
+        batched log event instead of one per character.
 
         Args:
-            character_id: The character's unique identifier.
+            specs: Sequence of (character_id, type_name, profile, properties,
+                   instructions, memory) tuples, in creation order.
 
         Returns:
-            The character agent instance.
+            The created character agent instances, in spec order.
 
         Raises:
-            KeyError: If the character is not found.
+            ValueError: If any spec names an unknown agent type. No agents
+                        are created or registered in that case.
         """
-        return self._characters[character_id]
+        type_names = {spec[1] for spec in specs}
+        unknown = type_names - self._agent_types.keys()
+        if unknown:
+            available = ", ".join(sorted(self._agent_types.keys())) or "(none)"
+            raise ValueError(
+                f"Unknown character agent type '{sorted(unknown)[0]}'. "
+                f"Available: {available}"
+            )
 
-    def has_character(self, character_id: str) -> bool:
-        """Check if a character exists in the registry.
+        # One lookup per distinct type; the creation loop then only touches
+        # this small local dict.
+        agent_types = {name: self._agent_types[name] for name in type_names}
+
+        new_characters: dict[str, "CharacterAgent"] = {}
+        for character_id, type_name, profile, properties, instructions, memory in specs:
+            new_characters[character_id] = agent_types[type_name].create_instance(
+                character_id=character_id,
+                character_profile=profile,
+                type_properties=properties,
+                instructions=instructions,
+                initial_memory=memory,
+            )
 
-        Args:
-            character_id: The character's unique identifier.
+        self._characters.update(new_characters)
+        self._character_ids_cache = None
+        log.info(
+            "characters_created",
+            count=len(new_characters),
+            character_ids=list(new_characters),
+            type_names=sorted(type_names),
+        )
 
-        Returns:
-            True if the character exists, False otherwise.
-        """
-        return character_id in self._characters
+        return list(new_characters.values())
 
     def list_characters(self) -> list[str]:
         """List all registered character IDs.
@@ -131,7 +189,9 @@ class CharacterRegistry(BaseModel):
         Returns:
             A list of character IDs.
         """
-        return list(self._characters.keys())
+        if self._character_ids_cache is None:
+            self._character_ids_cache = tuple(self._characters)
+        return list(self._character_ids_cache)
 
     def get_all_memories(self) -> dict[str, "CharacterMemory"]:
         """Get all character memories for persistence.
@@ -156,17 +216,23 @@ class CharacterRegistry(BaseModel):
         Raises:
             KeyError: If a character ID in memories doesn't exist.
         """
-        for char_id, memory in memories.items():
-            if char_id in self._characters:
-                # Replace the character's memory with the restored one
-                self._characters[char_id].memory = memory
-                log.debug("memory_restored", character_id=char_id)
-            else:
-                log.warning(
-                    "memory_restore_skipped",
-                    character_id=char_id,
-                    reason="character not found",
-                )
+        # Split hits from misses in one C-level set pass and batch the log
+        # emission instead of constructing an event per character.
+        known = self._characters.keys() & memories.keys()
+        unknown = memories.keys() - known
+
+        for char_id in known:
+            # Replace the character's memory with the restored one
+            self._characters[char_id].memory = memories[char_id]
+
+        if _stdlib_log.isEnabledFor(logging.DEBUG):
+            log.debug("memories_restored", count=len(known))
+        if unknown:
+            log.warning(
+                "memory_restore_skipped",
+                character_ids=sorted(unknown),
+                reason="characters not found",
+            )
 
     def list_agent_types(self) -> list[str]:
         """List all available agent type names.
@@ -174,7 +240,9 @@ class CharacterRegistry(BaseModel):
         Returns:
             A sorted list of agent type names.
         """
-        return sorted(self._agent_types.keys())
+        if self._sorted_types_cache is None:
+            self._sorted_types_cache = tuple(sorted(self._agent_types))
+        return list(self._sorted_types_cache)
 
     def get_agent_type(self, name: str) -> "CharacterAgentType":
         """Get an agent type by name.
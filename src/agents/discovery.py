@@ -4,7 +4,16 @@ This module provides functions to discover and load agent implementations
 from installed packages that register entry points.
 """
 
-from importlib.metadata import entry_points
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections.abc import Mapping
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,29 +21,171 @@ if TYPE_CHECKING:
     from agents.protocols import Architect, Editor, Narrator
 
 
-def discover_architects() -> dict[str, type]:
+_GROUPS = (
+    "storylord.architects",
+    "storylord.narrators",
+    "storylord.editors",
+    "storylord.character_agents",
+)
+
+_NAME_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "storylord"
+    / "entry_points.json"
+)
+
+
+@cache
+def _install_fingerprint() -> str:
+    """Fingerprint the installed environment for name-cache validation.
+
+    Installing or removing a distribution touches its sys.path directory,
+    so hashing the path entries' mtimes detects changes without reading
+    any package metadata.
+    """
+    hasher = hashlib.sha1()
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+        hasher.update(f"{entry}:{mtime}\n".encode())
+    return hasher.hexdigest()
+
+
+@cache
+def _read_name_cache() -> dict:
+    """Load the persisted name index, or an empty dict when unavailable."""
+    try:
+        return json.loads(_NAME_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_name_cache() -> None:
+    """Persist the freshly scanned name index for future processes."""
+    try:
+        payload = json.dumps(
+            {
+                "fingerprint": _install_fingerprint(),
+                "groups": {g: sorted(_entry_point_index(g)) for g in _GROUPS},
+            }
+        )
+        _NAME_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _NAME_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(payload)
+        tmp.replace(_NAME_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _cached_entry_point_names(group: str) -> list[str]:
+    """Names for a group, served stale-while-revalidate from disk.
+
+    The in-process caches don't help short-lived CLI invocations that
+    re-scan entry_points() every run. Name listings are persisted to a
+    small JSON file keyed by an installed-environment fingerprint: a
+    fresh hit skips the metadata scan entirely, a stale hit is served
+    immediately while a daemon thread rescans and rewrites the file, and
+    a miss falls back to a normal scan.
+
+    Args:
+        group: The entry-point group to list.
+
+    Returns:
+        The sorted entry-point names for the group.
+    """
+    data = _read_name_cache()
+    names = data.get("groups", {}).get(group)
+    if names is None:
+        names = sorted(_entry_point_index(group))
+        _write_name_cache()
+        return names
+    if data.get("fingerprint") != _install_fingerprint():
+        threading.Thread(
+            target=_write_name_cache, name="storylord-ep-refresh", daemon=True
+        ).start()
+    return list(names)
+
+
+@cache
+def _sorted_group_names(group: str) -> tuple[str, ...]:
+    """Memoized sorted name tuple for a group.
+
+    Repeated list_* calls in one process return copies of this tuple
+    instead of re-reading the disk cache and re-sorting; same pattern as
+    CharacterRegistry's cached list results.
+    """
+    return tuple(_cached_entry_point_names(group))
+
+
+@cache
+def _all_entry_points():
+    """Scan installed distribution metadata once for the whole process.
+
+    entry_points(group=...) performs a full metadata scan per call; the
+    per-group discover_* functions select from this single cached scan
+    instead of each paying for their own.
+    """
+    return entry_points()
+
+
+@cache
+def _entry_point_index(group: str) -> Mapping[str, EntryPoint]:
+    """Build the name index for a group without importing anything.
+
+    Loading an entry point drags in its module and transitive dependencies
+    (the LangChain/Anthropic stack for the bundled agents), which is far too
+    heavy for callers that only want names. The index holds the unloaded
+    EntryPoint objects; get_* helpers load a single target on demand.
+
+    Args:
+        group: The entry-point group to index.
+
+    Returns:
+        A read-only mapping of entry-point names to EntryPoint objects.
+    """
+    return MappingProxyType(
+        {ep.name: ep for ep in _all_entry_points().select(group=group)}
+    )
+
+
+@cache
+def discover_architects() -> Mapping[str, type]:
     """Discover all registered architects from installed packages.
 
+    The entry-point scan reads installed distribution metadata from disk,
+    so the result is computed once per process and shared; it is returned
+    read-only.
+
     Returns:
-        A dictionary mapping architect names to their classes.
+        A read-only mapping of architect names to their classes.
     """
-    eps = entry_points(group="storylord.architects")
-    return {ep.name: ep.load() for ep in eps}
+    index = _entry_point_index("storylord.architects")
+    return MappingProxyType({name: ep.load() for name, ep in index.items()})
 
 
-def discover_narrators() -> dict[str, type]:
+@cache
+def discover_narrators() -> Mapping[str, type]:
     """Discover all registered narrators from installed packages.
 
+    Cached per process; see discover_architects.
+
     Returns:
-        A dictionary mapping narrator names to their classes.
+        A read-only mapping of narrator names to their classes.
     """
-    eps = entry_points(group="storylord.narrators")
-    return {ep.name: ep.load() for ep in eps}
+    index = _entry_point_index("storylord.narrators")
+    return MappingProxyType({name: ep.load() for name, ep in index.items()})
 
 
+@cache
 def get_architect(name: str) -> "Architect":
     """Get an architect instance by name.
 
+    The instance is constructed once per name and shared by all callers;
+    architects keep no per-run state, and sharing preserves their cached
+    prompt/chain setup across repeated get_architect calls.
+
     Args:
         name: The registered name of the architect.
 
@@ -44,16 +195,19 @@ def get_architect(name: str) -> "Architect":
     Raises:
         ValueError: If the architect name is not found.
     """
-    architects = discover_architects()
-    if name not in architects:
-        available = ", ".join(sorted(architects.keys())) or "(none)"
+    index = _entry_point_index("storylord.architects")
+    if name not in index:
+        available = ", ".join(sorted(index.keys())) or "(none)"
         raise ValueError(f"Unknown architect '{name}'. Available: {available}")
-    return architects[name]()
+    return index[name].load()()
 
 
+@cache
 def get_narrator(name: str) -> "Narrator":
     """Get a narrator instance by name.
 
+    Cached per name and shared; see get_architect.
+
     Args:
         name: The registered name of the narrator.
 
@@ -63,11 +217,11 @@ def get_narrator(name: str) -> "Narrator":
     Raises:
         ValueError: If the narrator name is not found.
     """
-    narrators = discover_narrators()
-    if name not in narrators:
-        available = ", ".join(sorted(narrators.keys())) or "(none)"
+    index = _entry_point_index("storylord.narrators")
+    if name not in index:
+        available = ", ".join(sorted(index.keys())) or "(none)"
         raise ValueError(f"Unknown narrator '{name}'. Available: {available}")
-    return narrators[name]()
+    return index[name].load()()
 
 
 def list_architects() -> list[str]:
@@ -76,7 +230,7 @@ def list_architects() -> list[str]:
     Returns:
         A sorted list of registered architect names.
     """
-    return sorted(discover_architects().keys())
+    return list(_sorted_group_names("storylord.architects"))
 
 
 def list_narrators() -> list[str]:
@@ -85,22 +239,28 @@ def list_narrators() -> list[str]:
     Returns:
         A sorted list of registered narrator names.
     """
-    return sorted(discover_narrators().keys())
+    return list(_sorted_group_names("storylord.narrators"))
 
 
-def discover_editors() -> dict[str, type]:
+@cache
+def discover_editors() -> Mapping[str, type]:
     """Discover all registered editors from installed packages.
 
+    Cached per process; see discover_architects.
+
     Returns:
-        A dictionary mapping editor names to their classes.
+        A read-only mapping of editor names to their classes.
     """
-    eps = entry_points(group="storylord.editors")
-    return {ep.name: ep.load() for ep in eps}
+    index = _entry_point_index("storylord.editors")
+    return MappingProxyType({name: ep.load() for name, ep in index.items()})
 
 
+@cache
 def get_editor(name: str) -> "Editor":
     """Get an editor instance by name.
 
+    Cached per name and shared; see get_architect.
+
     Args:
         name: The registered name of the editor.
 
@@ -110,11 +270,11 @@ def get_editor(name: str) -> "Editor":
     Raises:
         ValueError: If the editor name is not found.
     """
-    editors = discover_editors()
-    if name not in editors:
-        available = ", ".join(sorted(editors.keys())) or "(none)"
+    index = _entry_point_index("storylord.editors")
+    if name not in index:
+        available = ", ".join(sorted(index.keys())) or "(none)"
         raise ValueError(f"Unknown editor '{name}'. Available: {available}")
-    return editors[name]()
+    return index[name].load()()
 
 
 def list_editors() -> list[str]:
@@ -123,17 +283,34 @@ def list_editors() -> list[str]:
     Returns:
         A sorted list of registered editor names.
     """
-    return sorted(discover_editors().keys())
+    return list(_sorted_group_names("storylord.editors"))
 
 
-def discover_character_agent_types() -> dict[str, "CharacterAgentType"]:
+@cache
+def _character_agent_type_instance(name: str) -> "CharacterAgentType":
+    """Load and instantiate one character agent type, exactly once.
+
+    Agent types are stateless factories, so a single shared instance per
+    name serves every caller; repeated lookups skip both the import and
+    the constructor.
+    """
+    return _entry_point_index("storylord.character_agents")[name].load()()
+
+
+@cache
+def discover_character_agent_types() -> Mapping[str, "CharacterAgentType"]:
     """Discover all registered character agent types from installed packages.
 
+    Cached per process; see discover_architects. Instances are shared with
+    get_character_agent_type, so each type is constructed exactly once.
+
     Returns:
-        A dictionary mapping character agent type names to their instances.
+        A read-only mapping of character agent type names to their instances.
     """
-    eps = entry_points(group="storylord.character_agents")
-    return {ep.name: ep.load()() for ep in eps}
+    index = _entry_point_index("storylord.character_agents")
+    return MappingProxyType(
+        {name: _character_agent_type_instance(name) for name in index}
+    )
 
 
 def get_character_agent_type(name: str) -> "CharacterAgentType":
@@ -148,13 +325,13 @@ def get_character_agent_type(name: str) -> "CharacterAgentType":
     Raises:
         ValueError: If the character agent type name is not found.
     """
-    types = discover_character_agent_types()
-    if name not in types:
-        available = ", ".join(sorted(types.keys())) or "(none)"
+    index = _entry_point_index("storylord.character_agents")
+    if name not in index:
+        available = ", ".join(sorted(index.keys())) or "(none)"
         raise ValueError(
             f"Unknown character agent type '{name}'. Available: {available}"
         )
-    return types[name]
+    return _character_agent_type_instance(name)
 
 
 def list_character_agent_types() -> list[str]:
@@ -163,4 +340,4 @@ def list_character_agent_types() -> list[str]:
     Returns:
         A sorted list of registered character agent type names.
     """
-    return sorted(discover_character_agent_types().keys())
+    return list(_sorted_group_names("storylord.character_agents"))
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+from functools import cache, cached_property
 from typing import TYPE_CHECKING
 
 import structlog
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate
 
+from agents._llm import get_chat_anthropic
 from models import EditedText, EditorInput
 
 if TYPE_CHECKING:
@@ -27,6 +27,25 @@ Make only necessary changes. Do not change text that is lies outside the guideli
 USER_PROMPT_TEMPLATE = """{text}"""
 
 
+@cache
+def _build_prompt():
+    """Compile the chat prompt once per process.
+
+    Template parsing extracts the placeholder variables; a fresh editor
+    instance per get_editor() call would otherwise re-parse identical
+    module-level strings. Imported lazily for the same reason as the
+    chain builder.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", SYSTEM_PROMPT),
+            ("user", USER_PROMPT_TEMPLATE),
+        ]
+    )
+
+
 class SimileSmasherEditor:
     """Editor that replaces similes with direct metaphors.
 
@@ -50,29 +69,59 @@ class SimileSmasherEditor:
         Returns:
             The text with similes converted to metaphors.
         """
-        chain = self._create_chain()
-
-        result = chain.invoke({"text": input.text})
+        text = input.text
+        result = self._chain.invoke({"text": text})
 
         log.info(
             "edit_complete",
             editor=self.name,
-            input_length=len(input.text),
+            input_length=len(text),
             output_length=len(result.text),
         )
 
         return result
 
-    def _create_chain(self):
-        """Create the LangChain chain for editing text."""
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514")
-        structured_llm = llm.with_structured_output(EditedText)
+    def edit_many(
+        self,
+        inputs: "list[EditorInput]",
+        tools: ToolRegistry | None = None,
+        max_concurrency: int = 8,
+    ) -> list[EditedText]:
+        """Edit several independent texts with overlapping LLM calls.
+
+        Each text is edited in isolation, so the network-bound model calls
+        can run concurrently; LangChain's batch API fans them out on a
+        thread pool capped at max_concurrency.
+
+        Args:
+            inputs: The editor inputs to process.
+            tools: Optional tool registry (not used by this editor).
+            max_concurrency: Maximum number of in-flight model calls.
+
+        Returns:
+            The edited texts, in input order.
+        """
+        results = self._chain.batch(
+            [{"text": input.text} for input in inputs],
+            config={"max_concurrency": max_concurrency},
+        )
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", SYSTEM_PROMPT),
-                ("user", USER_PROMPT_TEMPLATE),
-            ]
+        log.info(
+            "edit_batch_complete",
+            editor=self.name,
+            count=len(results),
         )
 
-        return prompt | structured_llm
+        return results
+
+    @cached_property
+    def _chain(self):
+        """The editing chain, built once on first use and reused.
+
+        Rebuilding per edit would redo ChatAnthropic construction and the
+        structured-output schema compile for every call.
+        """
+        llm = get_chat_anthropic("claude-sonnet-4-20250514")
+        structured_llm = llm.with_structured_output(EditedText)
+
+        return (_build_prompt() | structured_llm).with_config({"run_name": "simile-smasher-editor"})
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+from functools import cache, cached_property
 from typing import TYPE_CHECKING
 
 import structlog
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate
 
+from agents._llm import get_chat_anthropic
 from models import (
     BeatNarration,
     CharacterProfile,
@@ -112,6 +112,32 @@ inconsistencies, then provide a revised version that resolves them. If no confli
 return the narrative as-is."""
 
 
+@cache
+def _build_generation_prompt():
+    """Compile the generation prompt once per process."""
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", GENERATION_SYSTEM_PROMPT),
+            ("user", GENERATION_USER_TEMPLATE),
+        ]
+    )
+
+
+@cache
+def _build_evaluation_prompt():
+    """Compile the evaluation prompt once per process."""
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", EVALUATION_SYSTEM_PROMPT),
+            ("user", EVALUATION_USER_TEMPLATE),
+        ]
+    )
+
+
 class DefaultNarrator:
     """Default narrator implementation using Claude Sonnet.
 
@@ -143,20 +169,42 @@ class DefaultNarrator:
             A complete narrated story.
         """
         self._character_registry = character_registry
-        generation_chain = self._create_generation_chain()
-        evaluation_chain = self._create_evaluation_chain()
+        generation_chain = self._generation_chain
+        evaluation_chain = self._evaluation_chain
 
         all_narrations: list[BeatNarration] = []
         plot_events = input.story_architecture.plot_events
 
+        # Name lookup built once per run; resolving a beat's characters is
+        # then O(names on the beat) instead of a scan of the full cast.
+        char_by_name = {c.name: c for c in input.characters}
+
+        # Incrementally maintained formatted context: one block per completed
+        # plot event and one "--- ref ---" chunk per completed beat. Each
+        # section is rendered exactly once when it finishes, so composing the
+        # prior context / corpus for a beat is a join of cached strings
+        # instead of re-walking every earlier event and narration.
+        prior_event_blocks: list[str] = []
+        narration_chunks: list[str] = []
+
         for event_idx, plot_event in enumerate(plot_events):
-            prior_events = plot_events[:event_idx]
             event_title, event_summary = self._format_current_plot_event(plot_event)
+            current_beat_lines: list[str] = []
 
             for beat_idx, beat in enumerate(plot_event.beats):
                 beat_type, beat_description = self._format_story_beat(beat)
                 beat_reference = f"Event {event_idx + 1}, Beat {beat_idx + 1}"
 
+                # Both strings are invariant for the whole beat (nothing is
+                # appended until its iterations finish), so compose them once
+                # and share them between generation and both evaluation
+                # passes. The generation-time corpus and the evaluation-time
+                # full_corpus are the same string.
+                prior_context = self._compose_prior_context(
+                    prior_event_blocks, event_idx, plot_event, current_beat_lines
+                )
+                prior_narration = self._compose_prior_narration(narration_chunks)
+
                 # Build context for generation
                 generation_context = {
                     "event_title": event_title,
@@ -164,13 +212,11 @@ class DefaultNarrator:
                     "beat_type": beat_type,
                     "beat_description": beat_description,
                     "involved_characters": self._format_involved_characters(
-                        beat, input.characters
+                        beat, char_by_name
                     ),
                     "tone": input.tone,
-                    "prior_context": self._format_prior_context(
-                        prior_events, plot_event, beat_idx
-                    ),
-                    "prior_narration": self._format_prior_narration(all_narrations),
+                    "prior_context": prior_context,
+                    "prior_narration": prior_narration,
                 }
 
                 # Iteration 1: Generate initial narrative
@@ -191,10 +237,8 @@ class DefaultNarrator:
                         "current_narrative": narration.narrative_text,
                         "beat_type": beat_type,
                         "beat_description": beat_description,
-                        "full_corpus": self._format_prior_narration(all_narrations),
-                        "prior_context": self._format_prior_context(
-                            prior_events, plot_event, beat_idx
-                        ),
+                        "full_corpus": prior_narration,
+                        "prior_context": prior_context,
                     }
 
                     eval_result = evaluation_chain.invoke(eval_context)
@@ -232,36 +276,39 @@ class DefaultNarrator:
                         break
 
                 all_narrations.append(narration)
+                narration_chunks.append(
+                    f"--- {narration.beat_reference} ---\n"
+                    f"{narration.narrative_text}\n"
+                )
+                current_beat_lines.append(self._format_beat_line(beat))
 
-        return NarratedStory(narrations=all_narrations)
+            prior_event_blocks.append(
+                self._render_event_block(
+                    f"### Plot Event {event_idx + 1}: {plot_event.title}",
+                    plot_event.summary,
+                    current_beat_lines,
+                )
+            )
 
-    def _create_generation_chain(self):
-        """Create the LangChain chain for generating narrative prose."""
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514")
-        structured_llm = llm.with_structured_output(BeatNarration)
+        # The narrations are already-validated BeatNarration instances;
+        # wrapping them doesn't need another validation pass.
+        return NarratedStory.model_construct(narrations=all_narrations)
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", GENERATION_SYSTEM_PROMPT),
-                ("user", GENERATION_USER_TEMPLATE),
-            ]
-        )
+    @cached_property
+    def _generation_chain(self):
+        """The generation chain, built once on first use and reused."""
+        llm = get_chat_anthropic("claude-sonnet-4-20250514")
+        structured_llm = llm.with_structured_output(BeatNarration)
 
-        return prompt | structured_llm
+        return _build_generation_prompt() | structured_llm
 
-    def _create_evaluation_chain(self):
-        """Create the LangChain chain for evaluating and revising narrative."""
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514")
+    @cached_property
+    def _evaluation_chain(self):
+        """The evaluation chain, built once on first use and reused."""
+        llm = get_chat_anthropic("claude-sonnet-4-20250514")
         structured_llm = llm.with_structured_output(ConflictEvaluation)
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", EVALUATION_SYSTEM_PROMPT),
-                ("user", EVALUATION_USER_TEMPLATE),
-            ]
-        )
-
-        return prompt | structured_llm
+        return _build_evaluation_prompt() | structured_llm
 
     def _format_current_plot_event(self, event: PlotEvent) -> tuple[str, str]:
         """Format the current plot event title and summary."""
@@ -272,77 +319,73 @@ class DefaultNarrator:
         return beat.beat_type, beat.description
 
     def _format_involved_characters(
-        self, beat: StoryBeat, characters: list[CharacterProfile]
+        self, beat: StoryBeat, char_by_name: dict[str, CharacterProfile]
     ) -> str:
-        """Format character profiles for characters involved in this beat."""
-        involved_names = set(beat.characters_involved)
-        involved_chars = [c for c in characters if c.name in involved_names]
+        """Format character profiles for characters involved in this beat.
 
-        if not involved_chars:
+        Names are taken in the beat's own order (the author-intended one),
+        deduplicated with dict.fromkeys, and rendered as one f-string block
+        per profile feeding a single join.
+        """
+        blocks = [
+            f"### {char.name} ({char.role})\n"
+            f"**Description:** {char.description}\n"
+            f"**Motivations:** {char.motivations}\n"
+            f"**Relationships:** {char.relationships}\n"
+            for name in dict.fromkeys(beat.characters_involved)
+            if (char := char_by_name.get(name)) is not None
+        ]
+
+        if not blocks:
             return "No specific characters identified for this beat."
 
-        lines = []
-        for char in involved_chars:
-            lines.append(f"### {char.name} ({char.role})")
-            lines.append(f"**Description:** {char.description}")
-            lines.append(f"**Motivations:** {char.motivations}")
-            lines.append(f"**Relationships:** {char.relationships}")
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(blocks)
+
+    def _format_beat_line(self, beat: StoryBeat) -> str:
+        """Format one completed beat as a prior-context bullet line."""
+        return (
+            f"- [{beat.beat_type}] {beat.description} "
+            f"(Characters: {beat.characters_joined})"
+        )
+
+    def _render_event_block(
+        self,
+        header: str,
+        summary: str,
+        beat_lines: list[str],
+    ) -> str:
+        """Render one plot event section from its already-formatted beat lines."""
+        return "\n".join([header, f"{summary}\n", *beat_lines, ""])
 
-    def _format_prior_context(
+    def _compose_prior_context(
         self,
-        prior_events: list[PlotEvent],
+        prior_event_blocks: list[str],
+        event_idx: int,
         current_event: PlotEvent,
-        current_beat_idx: int,
+        current_beat_lines: list[str],
     ) -> str:
-        """Format all prior plot events and beats for context."""
-        if not prior_events and current_beat_idx == 0:
+        """Compose the prior-context section from cached event blocks.
+
+        Completed events arrive pre-rendered; only the current event's
+        partial section (its already-completed beats) is assembled here.
+        """
+        if not prior_event_blocks and not current_beat_lines:
             return "This is the beginning of the story. No prior context."
 
-        lines = []
-
-        # Previous plot events
-        for i, event in enumerate(prior_events, 1):
-            lines.append(f"### Plot Event {i}: {event.title}")
-            lines.append(f"{event.summary}\n")
-            for beat in event.beats:
-                chars = (
-                    ", ".join(beat.characters_involved)
-                    if beat.characters_involved
-                    else "None"
-                )
-                lines.append(
-                    f"- [{beat.beat_type}] {beat.description} (Characters: {chars})"
-                )
-            lines.append("")
-
-        # Earlier beats from current event
-        if current_beat_idx > 0:
-            event_num = len(prior_events) + 1
-            lines.append(f"### Plot Event {event_num} (Current): {current_event.title}")
-            lines.append(f"{current_event.summary}\n")
-            for beat in current_event.beats[:current_beat_idx]:
-                chars = (
-                    ", ".join(beat.characters_involved)
-                    if beat.characters_involved
-                    else "None"
+        blocks = list(prior_event_blocks)
+        if current_beat_lines:
+            blocks.append(
+                self._render_event_block(
+                    f"### Plot Event {event_idx + 1} (Current): "
+                    f"{current_event.title}",
+                    current_event.summary,
+                    current_beat_lines,
                 )
-                lines.append(
-                    f"- [{beat.beat_type}] {beat.description} (Characters: {chars})"
-                )
-            lines.append("")
-
-        return "\n".join(lines) if lines else "No prior context."
+            )
+        return "\n".join(blocks)
 
-    def _format_prior_narration(self, narrations: list[BeatNarration]) -> str:
-        """Format all previously written narrative text."""
-        if not narrations:
+    def _compose_prior_narration(self, narration_chunks: list[str]) -> str:
+        """Compose the full prior narrative from cached per-beat chunks."""
+        if not narration_chunks:
             return "No narrative has been written yet. This is the first beat."
-
-        lines = []
-        for narration in narrations:
-            lines.append(f"--- {narration.beat_reference} ---")
-            lines.append(narration.narrative_text)
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(narration_chunks)
@@ -1,11 +1,25 @@
+import atexit
 import logging.config
+import logging.handlers
 import os
+import threading
 from pathlib import Path
 
 import structlog
+from pydantic_core import to_json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _json_log_serializer(obj, default=None, **_kw):
+    """Serialize a log event dict with pydantic-core's Rust encoder.
+
+    Roughly 2x faster than stdlib json.dumps per line, which matters for
+    the chatty per-beat events; serialize_unknown stringifies anything
+    the encoder doesn't recognize so logging never raises.
+    """
+    return to_json(obj, fallback=default, serialize_unknown=True).decode()
+
+
 class Settings(BaseSettings):
     anthropic_api_key: str
 
@@ -13,7 +27,15 @@ class Settings(BaseSettings):
 
 
 def configure_logging():
-    """Configure structlog with stdlib logging integration."""
+    """Configure structlog with stdlib logging integration.
+
+    Skipped when the root logger already has handlers: embedding
+    applications that configured logging before importing storylord keep
+    their setup instead of having it clobbered by this import-time hook.
+    """
+    if logging.getLogger().handlers:
+        return
+
     # Ensure log directory exists
     Path("logs").mkdir(exist_ok=True)
 
@@ -35,6 +57,7 @@ def configure_logging():
         default_columns["event"],
         structlog.dev.Column("", default_renderer._default_column_formatter),
     ]
+    console_renderer = structlog.dev.ConsoleRenderer(columns=console_columns)
 
     logging.config.dictConfig(
         {
@@ -45,7 +68,7 @@ def configure_logging():
                     "()": structlog.stdlib.ProcessorFormatter,
                     "processors": [
                         structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                        structlog.dev.ConsoleRenderer(columns=console_columns),
+                        console_renderer,
                     ],
                     "foreign_pre_chain": shared_processors,
                 },
@@ -53,7 +76,9 @@ def configure_logging():
                     "()": structlog.stdlib.ProcessorFormatter,
                     "processors": [
                         structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                        structlog.processors.JSONRenderer(),
+                        structlog.processors.JSONRenderer(
+                            serializer=_json_log_serializer
+                        ),
                     ],
                     "foreign_pre_chain": shared_processors,
                 },
@@ -63,11 +88,28 @@ def configure_logging():
                     "class": "logging.StreamHandler",
                     "formatter": "console",
                 },
+                # Emitting threads only render the JSON line and enqueue it;
+                # the blocking file write happens on the QueueListener's
+                # thread instead of serializing graph execution on disk
+                # latency. The formatter sits on the queue handler because
+                # QueueHandler.prepare() must flatten the structlog event
+                # dict before it crosses the queue.
                 "file": {
-                    "class": "logging.handlers.WatchedFileHandler",
-                    "filename": "logs/storylord.log",
+                    "class": "logging.handlers.QueueHandler",
+                    "listener": "logging.handlers.QueueListener",
+                    "handlers": ["file_output"],
                     "formatter": "json",
                 },
+                # The app owns rotation itself rather than watching for an
+                # external rotator: WatchedFileHandler re-stats the file on
+                # every emit, one extra syscall per line for a rotation
+                # scheme nothing here uses.
+                "file_output": {
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": "logs/storylord.log",
+                    "maxBytes": 50_000_000,
+                    "backupCount": 3,
+                },
             },
             "loggers": {
                 "": {
@@ -81,6 +123,12 @@ def configure_logging():
         }
     )
 
+    # dictConfig builds the listener but leaves starting it to us; drain
+    # the queue on interpreter exit so no lines are lost.
+    queue_handler = logging.getHandlerByName("file")
+    queue_handler.listener.start()
+    atexit.register(queue_handler.listener.stop)
+
     # Configure structlog to use stdlib
     structlog.configure(
         processors=[
@@ -104,6 +152,29 @@ def initialize_environment():
     return settings
 
 
+def preload_llm_modules():
+    """Warm the LangChain/Anthropic imports on a background thread.
+
+    The agent modules import these lazily so discovery and listing stay
+    cheap, but any run that reaches a model call still pays the full
+    import cost at first use. Kicking the import off at startup overlaps
+    that disk I/O with argument parsing and entry-point scanning; the
+    interpreter's import lock makes a concurrent foreground import wait
+    for this one instead of duplicating work. Import errors are left for
+    the foreground import to surface with proper context.
+    """
+
+    def _import() -> None:
+        try:
+            import langchain_anthropic  # noqa: F401
+            import langchain_core.prompts  # noqa: F401
+        except Exception:
+            pass
+
+    threading.Thread(target=_import, name="llm-preload", daemon=True).start()
+
+
 # Auto-initialize when module is imported
 configure_logging()
 settings = initialize_environment()
+preload_llm_modules()
@@ -1,27 +1,43 @@
 """Delta computation for text edits."""
 
 import difflib
+import re
+
+# Tokens are runs of non-space or runs of whitespace, so joining any slice
+# reproduces the source text exactly.
+_TOKEN = re.compile(r"\S+|\s+")
 
 
 def compute_text_delta(original: str, edited: str) -> list[dict]:
     """Compute a list of changes between original and edited text.
 
+    The diff runs at word granularity: SequenceMatcher is pure Python and
+    quadratic in the worst case, so matching whole-word tokens instead of
+    characters shrinks its input by roughly the average word length and
+    keeps delta computation negligible next to the editor's LLM call.
+    Change snippets are therefore word-aligned rather than
+    character-aligned, and the matcher's autojunk heuristic may merge
+    edits that share only very common words between them.
+
     Returns a list of dicts with "original" and "edited" keys for each change.
     Returns empty list if texts are identical.
     """
     if original == edited:
         return []
 
+    original_tokens = _TOKEN.findall(original)
+    edited_tokens = _TOKEN.findall(edited)
+
     deltas = []
-    matcher = difflib.SequenceMatcher(None, original, edited)
+    matcher = difflib.SequenceMatcher(None, original_tokens, edited_tokens)
 
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         if tag == "equal":
             continue
         deltas.append(
             {
-                "original": original[i1:i2],
-                "edited": edited[j1:j2],
+                "original": "".join(original_tokens[i1:i2]),
+                "edited": "".join(edited_tokens[j1:j2]),
             }
         )
 
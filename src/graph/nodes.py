@@ -1,10 +1,14 @@
 """Node functions for story generation graph."""
 
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
 
 import structlog
+from pydantic_core import to_json
 
 from agents.character.registry import CharacterRegistry
 from agents.discovery import (
@@ -20,11 +24,60 @@ from tools.registry import ToolRegistry
 
 log = structlog.get_logger(__name__)
 
+# Output artifacts are written off the critical path: the narrator only
+# needs the in-memory architecture, not the file, so the graph proceeds
+# while the disk (possibly network-mounted) catches up. The atexit hook
+# drains pending writes before the interpreter exits.
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="storylord-io")
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+
+def _write_in_background(write, event: str, path: Path) -> None:
+    """Submit a file write to the I/O pool, logging success or failure."""
+
+    def _done(future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            log.error(f"{event}_failed", path=str(path), error=str(exc))
+        else:
+            log.info(event, path=str(path))
+
+    _IO_POOL.submit(write).add_done_callback(_done)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a sibling temp file and rename it into place.
+
+    A crash mid-write leaves the previous artifact (or nothing) at the
+    final path instead of a truncated file; same pattern as the
+    discovery name cache.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=16)
+def _tool_registry(tool_names: tuple[str, ...]) -> ToolRegistry:
+    """One shared ToolRegistry per tool-name tuple.
+
+    Registry construction loads every named tool; it is read-only after
+    that, so repeat runs with the same tool list (TUI sessions, batch
+    generation) reuse the instance instead of re-resolving tools.
+    """
+    return ToolRegistry(list(tool_names))
+
 
 def load_input_node(state: StoryGenerationState) -> dict:
     """Initialize tool_registry, character_registry, and tracking flags."""
     story_input = state["story_input"]
-    tool_registry = ToolRegistry(story_input.tools) if story_input.tools else None
+    tool_registry = (
+        _tool_registry(tuple(story_input.tools)) if story_input.tools else None
+    )
+
+    # Create the output directory once per run; the save nodes assume it
+    # exists instead of re-issuing the mkdir syscall on every invocation.
+    Path(state["output_dir"]).mkdir(parents=True, exist_ok=True)
 
     # Create character registry and populate with characters that have agent_config
     agent_types = discover_character_agent_types()
@@ -54,7 +107,11 @@ def architect_node(state: StoryGenerationState) -> dict:
     architect = get_architect(story_input.architect)
     log.info("running_architect", architect=story_input.architect)
 
-    architect_input = ArchitectInput(
+    # Every field below is a trusted primitive or an already-validated
+    # model out of state, so skip pydantic's re-validation pass. Boundary
+    # data (the user's YAML, LLM structured output) still gets the full
+    # model_validate treatment where it enters the system.
+    architect_input = ArchitectInput.model_construct(
         story_idea=story_input.story_idea,
         characters=story_input.characters,
         num_plot_events=story_input.num_plot_events,
@@ -76,10 +133,17 @@ def save_architecture_node(state: StoryGenerationState) -> dict:
     output_dir = Path(state["output_dir"])
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    output_dir.mkdir(exist_ok=True)
     arch_path = output_dir / f"{story_input.output_file}_architecture_{timestamp}.json"
-    arch_path.write_text(architecture.model_dump_json(indent=2))
-    log.info("architecture_saved", path=str(arch_path))
+    # Serialize straight to bytes in pydantic's Rust core: no intermediate
+    # Python str and no re-encode inside write_text, which matters for deep
+    # plot/beat trees. Compact output -- the file is a machine artifact;
+    # pipe it through `jq .` when a human needs to read one.
+    payload = to_json(architecture)
+    _write_in_background(
+        lambda: _atomic_write_bytes(arch_path, payload),
+        "architecture_saved",
+        arch_path,
+    )
 
     return {"architecture_saved": True}
 
@@ -94,7 +158,7 @@ def narrator_node(state: StoryGenerationState) -> dict:
     narrator = get_narrator(story_input.narrator)
     log.info("running_narrator", narrator=story_input.narrator)
 
-    narrator_input = NarratorInput(
+    narrator_input = NarratorInput.model_construct(
         story_architecture=architecture,
         characters=story_input.characters,
         tone=story_input.tone,
@@ -116,26 +180,58 @@ def narrator_node(state: StoryGenerationState) -> dict:
     }
 
 
-def editor_node(state: StoryGenerationState) -> dict:
-    """Edit one narration at a time for checkpoint granularity."""
-    narrated_story = state["narrated_story"]
-    current_index = state["current_narration_index"]
+def edit_all_node(state: StoryGenerationState) -> dict:
+    """Edit every narration in one pass with overlapping model calls.
 
-    narration = narrated_story.narrations[current_index]
+    Narrations are independent, so the network-bound editor calls run
+    concurrently, and the whole pass is one graph step: checkpoint
+    serialization and state merging happen once instead of once per
+    narration as under the old editor recursion.
+    """
+    narrated_story = state["narrated_story"]
+    narrations = narrated_story.narrations
 
-    log.info("running_editor", editor="simile-smasher")
+    log.info("running_editor", editor="simile-smasher", count=len(narrations))
     editor = get_editor("simile-smasher")
-    editor_input = EditorInput(text=narration.narrative_text)
-    edited = editor.edit(editor_input)
-
-    # Compute and log delta
-    delta = compute_text_delta(narration.narrative_text, edited.text)
-    log.info("narration_edited", beat_reference=narration.beat_reference, delta=delta)
+    inputs = [
+        EditorInput.model_construct(text=narration.narrative_text)
+        for narration in narrations
+    ]
+
+    # The bundled editors fan out through their batch API; the Editor
+    # protocol only requires edit(), so anything else goes through a
+    # thread pool for the same concurrency.
+    if hasattr(editor, "edit_many"):
+        results = editor.edit_many(inputs)
+    else:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(editor.edit, inputs))
+
+    edit_history = []
+    for narration, edited in zip(narrations, results):
+        delta = compute_text_delta(narration.narrative_text, edited.text)
+        # Full deltas land in edit_history state; per-beat emission is
+        # debug-only so the default INFO config renders one summary line
+        # instead of N console/json passes through the processor chain.
+        log.debug(
+            "narration_edited", beat_reference=narration.beat_reference, delta=delta
+        )
+        edit_history.append(
+            {"beat_reference": narration.beat_reference, "delta": delta}
+        )
+
+    if narrations:
+        log.info(
+            "narrations_edited",
+            count=len(narrations),
+            first=narrations[0].beat_reference,
+            last=narrations[-1].beat_reference,
+            changed=sum(1 for entry in edit_history if entry["delta"]),
+        )
 
     return {
-        "edited_narrations": [edited.text],  # Uses reducer to append
-        "current_narration_index": current_index + 1,
-        "edit_history": [{"beat_reference": narration.beat_reference, "delta": delta}],
+        "edited_narrations": [edited.text for edited in results],
+        "edit_history": edit_history,
     }
 
 
@@ -149,22 +245,19 @@ def save_narrative_node(state: StoryGenerationState) -> dict:
     output_dir = Path(state["output_dir"])
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    output_dir.mkdir(exist_ok=True)
     narrative_path = output_dir / f"{story_input.output_file}_narrative_{timestamp}.txt"
-    narrative_text = "\n\n".join(edited_narrations)
-    narrative_path.write_text(narrative_text)
-    log.info("narrative_saved", path=str(narrative_path))
+    # Stream the narrations through a buffered handle rather than joining
+    # them first: the join would transiently double the story's memory
+    # footprint just to produce one big string for write_text.
+    def _write_narrative() -> None:
+        tmp = narrative_path.with_suffix(narrative_path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            for i, narration_text in enumerate(edited_narrations):
+                if i:
+                    f.write("\n\n")
+                f.write(narration_text)
+        os.replace(tmp, narrative_path)
+
+    _write_in_background(_write_narrative, "narrative_saved", narrative_path)
 
     return {"narrative_saved": True}
-
-
-def should_continue_editing(
-    state: StoryGenerationState,
-) -> Literal["editor", "save_narrative"]:
-    """Determine if there are more narrations to edit."""
-    narrated_story = state["narrated_story"]
-    current_index = state["current_narration_index"]
-
-    if current_index < len(narrated_story.narrations):
-        return "editor"
-    return "save_narrative"
@@ -1,8 +1,5 @@
 """State schema for story generation graph."""
 
-import operator
-from typing import Annotated
-
 from typing_extensions import TypedDict
 
 from agents.character.registry import CharacterRegistry
@@ -18,9 +15,8 @@ class StoryGenerationState(TypedDict):
     character_registry: CharacterRegistry | None
     architecture: StoryArchitecture | None
     narrated_story: NarratedStory | None
-    edited_narrations: Annotated[list[str], operator.add]  # Reducer for append
-    edit_history: Annotated[list[dict], operator.add]  # [{beat_reference, delta}, ...]
-    current_narration_index: int
+    edited_narrations: list[str]  # Written whole by edit_all_node
+    edit_history: list[dict]  # [{beat_reference, delta}, ...]
     output_dir: str
     architecture_saved: bool
     narrative_saved: bool
@@ -5,12 +5,11 @@ from langgraph.graph import END, START, StateGraph
 
 from graph.nodes import (
     architect_node,
-    editor_node,
+    edit_all_node,
     load_input_node,
     narrator_node,
     save_architecture_node,
     save_narrative_node,
-    should_continue_editing,
 )
 from graph.state import StoryGenerationState
 
@@ -32,20 +31,16 @@ def build_story_generation_graph(checkpointer=None):
     builder.add_node("architect", architect_node)
     builder.add_node("save_architecture", save_architecture_node)
     builder.add_node("narrator", narrator_node)
-    builder.add_node("editor", editor_node)
+    builder.add_node("edit_all", edit_all_node)
     builder.add_node("save_narrative", save_narrative_node)
 
-    # Linear flow with editor loop
+    # Linear flow; edit_all handles every narration in one step
     builder.add_edge(START, "load_input")
     builder.add_edge("load_input", "architect")
     builder.add_edge("architect", "save_architecture")
     builder.add_edge("save_architecture", "narrator")
-    builder.add_edge("narrator", "editor")
-    builder.add_conditional_edges(
-        "editor",
-        should_continue_editing,
-        {"editor": "editor", "save_narrative": "save_narrative"},
-    )
+    builder.add_edge("narrator", "edit_all")
+    builder.add_edge("edit_all", "save_narrative")
     builder.add_edge("save_narrative", END)
 
     return builder.compile(checkpointer=checkpointer or MemorySaver())
@@ -1,20 +1,33 @@
+from collections import deque
+from functools import cached_property
+from itertools import islice
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Upper bound on per-character event/emotion history. get_summary and
+# get_emotional_arc only ever read the most recent handful, so capping the
+# backing deques keeps memory flat over arbitrarily long stories; the cap
+# is far beyond what any story here produces.
+_MAX_MEMORY_ITEMS = 1000
 
 
 class MemoryEvent(BaseModel):
     """A single event in character memory."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_type: str  # spoke, thought, chose, heard, witnessed
     content: str
     scene_reference: str = ""
-    other_characters: list[str] = []
+    other_characters: list[str] = Field(default_factory=list)
 
 
 class EmotionalSnapshot(BaseModel):
     """A point-in-time capture of emotional state."""
 
+    model_config = ConfigDict(frozen=True)
+
     state: str
     trigger: str = ""
     scene_reference: str = ""
@@ -23,6 +36,8 @@ class EmotionalSnapshot(BaseModel):
 class KnowledgeItem(BaseModel):
     """Something the character has learned."""
 
+    model_config = ConfigDict(frozen=True)
+
     fact: str
     source: str = ""  # how they learned it
     confidence: float = 1.0
@@ -34,18 +49,32 @@ class RelationshipState(BaseModel):
     character_name: str
     sentiment: str = "neutral"  # positive, negative, neutral, conflicted
     trust_level: float = 0.5  # 0.0 to 1.0
-    notes: list[str] = []
+    notes: list[str] = Field(default_factory=list)
 
 
 class CharacterMemory(BaseModel):
     """Persistent memory for a character across scenes."""
 
-    events: list[MemoryEvent] = []
-    emotional_arc: list[EmotionalSnapshot] = []
-    knowledge: list[KnowledgeItem] = []
-    relationships: dict[str, RelationshipState] = {}
+    events: deque[MemoryEvent] = Field(
+        default_factory=lambda: deque(maxlen=_MAX_MEMORY_ITEMS)
+    )
+    emotional_arc: deque[EmotionalSnapshot] = Field(
+        default_factory=lambda: deque(maxlen=_MAX_MEMORY_ITEMS)
+    )
+    knowledge: list[KnowledgeItem] = Field(default_factory=list)
+    relationships: dict[str, RelationshipState] = Field(default_factory=dict)
     current_emotional_state: str = "neutral"
 
+    @field_validator("events", "emotional_arc", mode="after")
+    @classmethod
+    def _bound_history(cls, value: deque) -> deque:
+        """Rebuild unbounded history (e.g. from a restored checkpoint) with
+        the maxlen cap; pydantic serializes the deques back to JSON arrays.
+        """
+        if value.maxlen is None:
+            return deque(value, maxlen=_MAX_MEMORY_ITEMS)
+        return value
+
     def add_interaction(
         self,
         event_type: str,
@@ -136,10 +165,12 @@ class CharacterMemory(BaseModel):
         """
         lines = []
         if self.events:
-            recent = self.events[-max_events:]
             lines.append("Recent events:")
-            for event in recent:
-                lines.append(f"  - [{event.event_type}] {event.content[:80]}...")
+            start = max(0, len(self.events) - max_events)
+            lines.extend(
+                f"  - [{event.event_type}] {event.content[:80]}..."
+                for event in islice(self.events, start, None)
+            )
 
         if self.knowledge:
             lines.append(f"Known facts: {len(self.knowledge)} items")
@@ -152,7 +183,7 @@ class CharacterMemory(BaseModel):
 
         lines.append(f"Current emotional state: {self.current_emotional_state}")
 
-        return "\n".join(lines) if lines else "No significant memories yet."
+        return "\n".join(lines)
 
     def get_emotional_arc(self) -> str:
         """Get a summary of the character's emotional journey.
@@ -163,13 +194,16 @@ class CharacterMemory(BaseModel):
         if not self.emotional_arc:
             return "Emotional state has remained stable."
 
-        states = [snap.state for snap in self.emotional_arc[-5:]]
+        start = max(0, len(self.emotional_arc) - 5)
+        states = [snap.state for snap in islice(self.emotional_arc, start, None)]
         return f"Recent emotional states: {' -> '.join(states)}"
 
 
 class CharacterAgentConfig(BaseModel):
     """Agent configuration for a character."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_type: str = "default"
     agent_properties: dict[str, Any] = Field(default_factory=dict)
     agent_instructions: str = ""
@@ -178,6 +212,8 @@ class CharacterAgentConfig(BaseModel):
 class CharacterProfile(BaseModel):
     """A character in the story with their profile details."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     role: str  # protagonist, antagonist, supporting, etc.
@@ -190,6 +226,8 @@ class CharacterProfile(BaseModel):
 class ArchitectInput(BaseModel):
     """Input parameters for the architect agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     story_idea: str
     characters: list[CharacterProfile]
     num_plot_events: int
@@ -200,6 +238,8 @@ class ArchitectInput(BaseModel):
 class StoryInput(BaseModel):
     """Input for the complete story generation pipeline."""
 
+    model_config = ConfigDict(frozen=True)
+
     story_idea: str
     characters: list[CharacterProfile]
     num_plot_events: int
@@ -216,14 +256,28 @@ class StoryInput(BaseModel):
 class StoryBeat(BaseModel):
     """A narrative event within a plot event."""
 
+    model_config = ConfigDict(frozen=True)
+
     description: str
     beat_type: str  # conversation, action, occurrence, internal_dialogue, etc.
     characters_involved: list[str]
 
+    @cached_property
+    def characters_joined(self) -> str:
+        """The involved characters joined for display, or "None" when empty.
+
+        Cached so repeated context renders don't re-join the same list.
+        """
+        if not self.characters_involved:
+            return "None"
+        return ", ".join(self.characters_involved)
+
 
 class PlotEvent(BaseModel):
     """A major plot point containing story beats."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     summary: str
     beats: list[StoryBeat]
@@ -232,6 +286,8 @@ class PlotEvent(BaseModel):
 class StoryArchitecture(BaseModel):
     """Complete story structure with all plot events and their beats."""
 
+    model_config = ConfigDict(frozen=True)
+
     plot_events: list[PlotEvent]
 
 
@@ -241,6 +297,8 @@ class StoryArchitecture(BaseModel):
 class NarratorInput(BaseModel):
     """Input parameters for the narrator agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     story_architecture: StoryArchitecture
     characters: list[CharacterProfile]
     tone: str
@@ -256,6 +314,8 @@ class BeatNarration(BaseModel):
 class ConflictEvaluation(BaseModel):
     """Result of evaluating narrative against the story corpus."""
 
+    model_config = ConfigDict(frozen=True)
+
     conflicts_found: list[str]
     revised_narrative: str
 
@@ -272,6 +332,8 @@ class NarratedStory(BaseModel):
 class EditorInput(BaseModel):
     """Input parameters for the editor agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
 
 
@@ -4,21 +4,46 @@ This module provides functions to discover and load tool implementations
 from installed packages that register entry points.
 """
 
-from importlib.metadata import entry_points
+from collections.abc import Mapping
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tools.protocols import Tool
 
 
-def discover_tools() -> dict[str, type]:
+@cache
+def _entry_point_index() -> Mapping[str, EntryPoint]:
+    """Build the tool name index once per process, without importing anything.
+
+    entry_points() scans installed distribution metadata on every call;
+    previously a registry built with N tool names paid that scan N+1
+    times. The index holds unloaded EntryPoint objects so name lookups
+    and listings never import a tool module.
+
+    Returns:
+        A read-only mapping of tool names to EntryPoint objects.
+    """
+    return MappingProxyType(
+        {ep.name: ep for ep in entry_points(group="storylord.tools")}
+    )
+
+
+@cache
+def discover_tools() -> Mapping[str, type]:
     """Discover all registered tools from installed packages.
 
+    Computed once per process from the cached index and shared; the
+    result is returned read-only.
+
     Returns:
-        A dictionary mapping tool names to their classes.
+        A read-only mapping of tool names to their classes.
     """
-    eps = entry_points(group="storylord.tools")
-    return {ep.name: ep.load() for ep in eps}
+    return MappingProxyType(
+        {name: ep.load() for name, ep in _entry_point_index().items()}
+    )
 
 
 def get_tool(name: str) -> "Tool":
@@ -33,11 +58,11 @@ def get_tool(name: str) -> "Tool":
     Raises:
         ValueError: If the tool name is not found.
     """
-    tools = discover_tools()
-    if name not in tools:
-        available = ", ".join(sorted(tools.keys())) or "(none)"
+    index = _entry_point_index()
+    if name not in index:
+        available = ", ".join(sorted(index.keys())) or "(none)"
         raise ValueError(f"Unknown tool '{name}'. Available: {available}")
-    return tools[name]()
+    return index[name].load()()
 
 
 def list_tools() -> list[str]:
@@ -46,4 +71,4 @@ def list_tools() -> list[str]:
     Returns:
         A sorted list of registered tool names.
     """
-    return sorted(discover_tools().keys())
+    return sorted(_entry_point_index())
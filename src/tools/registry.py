@@ -7,7 +7,7 @@ and execute tools during story generation.
 import structlog
 from typing import Any
 
-from tools.discovery import discover_tools
+from tools.discovery import _entry_point_index
 from tools.protocols import Tool
 
 log = structlog.get_logger(__name__)
@@ -29,14 +29,29 @@ class ToolRegistry:
         self._tools: dict[str, Tool] = {}
 
         if tool_names:
-            available = discover_tools()
+            # Load only the requested tools from the cached entry-point
+            # index; discover_tools() would import every registered tool
+            # module (and its transitive deps) just to pick a few.
+            available = _entry_point_index()
             for name in tool_names:
                 if name in available:
-                    self._tools[name] = available[name]()
+                    self._tools[name] = available[name].load()()
                     log.debug("tool_loaded", tool=name)
                 else:
                     log.warning("tool_not_found", tool=name)
 
+        # Schemas never change after construction (the registry has no
+        # mutation paths), so build the list_tools result once instead of
+        # re-calling every tool's get_schema on each LLM turn.
+        self._schema_cache = tuple(
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.get_schema(),
+            }
+            for tool in self._tools.values()
+        )
+
     def get(self, name: str) -> Tool:
         """Get a tool by name.
 
@@ -57,14 +72,7 @@ class ToolRegistry:
         Returns:
             A list of tool schema dictionaries suitable for LLM binding.
         """
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.get_schema(),
-            }
-            for tool in self._tools.values()
-        ]
+        return list(self._schema_cache)
 
     def execute(self, name: str, **params: Any) -> Any:
         """Execute a tool by name.
@@ -79,7 +87,9 @@ class ToolRegistry:
         Raises:
             KeyError: If the tool is not in the registry.
         """
-        log.info("tool_executing", tool=name, params=params)
+        # Keys only: repr-formatting full payloads (search queries, API
+        # bodies) on every call is wasted work nobody reads at INFO.
+        log.debug("tool_executing", tool=name, param_keys=list(params))
         result = self._tools[name].execute(**params)
         log.info("tool_executed", tool=name)
         return result
@@ -1,5 +1,7 @@
 """StoryLord TUI application."""
 
+from functools import cache
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Vertical
@@ -90,19 +92,41 @@ class EditorScreen(ModalScreen):
         self.app.push_screen(FileInputModal(), self._load_file_callback)
 
     def _load_file_callback(self, file_path: str | None) -> None:
-        """Load the file contents into the input area."""
+        """Kick off the file load on a worker thread."""
         if file_path:
-            try:
-                with open(file_path) as f:
-                    content = f.read()
-                input_area = self.query_one("#editor-input", TextArea)
-                input_area.text = content
-            except FileNotFoundError:
-                output_area = self.query_one("#editor-output", TextArea)
-                output_area.text = f"File not found: {file_path}"
-            except Exception as e:
-                output_area = self.query_one("#editor-output", TextArea)
-                output_area.text = f"Error loading file: {e}"
+            self._load_file_worker(file_path)
+
+    @work(thread=True)
+    def _load_file_worker(self, file_path: str) -> None:
+        """Read and decode the file off the event loop.
+
+        A large file read in the message handler would freeze the UI;
+        the read and decode happen here (one pass, one decode) and only
+        the widget update hops back to the app thread, same pattern as
+        the editor worker.
+        """
+        worker = get_current_worker()
+        try:
+            with open(file_path, "rb", buffering=65536) as f:
+                content = f.read().decode("utf-8", "replace")
+        except FileNotFoundError:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(
+                    self._update_output, f"File not found: {file_path}"
+                )
+        except Exception as e:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(
+                    self._update_output, f"Error loading file: {e}"
+                )
+        else:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._set_input_text, content)
+
+    def _set_input_text(self, text: str) -> None:
+        """Update the input area with loaded file contents."""
+        input_area = self.query_one("#editor-input", TextArea)
+        input_area.text = text
 
 
 class FileInputModal(ModalScreen[str | None]):
@@ -128,6 +152,30 @@ class FileInputModal(ModalScreen[str | None]):
         self.dismiss(None)
 
 
+@cache
+def _render_agents_text() -> str:
+    """Render the agents listing once per process.
+
+    The installed agents can't change while the app runs, so every
+    modal open reuses the same rendered string.
+    """
+    content = ["Available Agents", ""]
+    content.append("Architects:")
+    content.extend(f"  - {name}" for name in list_architects())
+    content.append("")
+    content.append("Narrators:")
+    content.extend(f"  - {name}" for name in list_narrators())
+    content.append("")
+    content.append("Editors:")
+    content.extend(f"  - {name}" for name in list_editors())
+    content.append("")
+    content.append("Character Agents:")
+    content.extend(f"  - {name}" for name in list_character_agent_types())
+    content.append("")
+    content.append("Press ESC to close")
+    return "\n".join(content)
+
+
 class AgentsModal(ModalScreen):
     """Modal screen displaying available agents."""
 
@@ -137,29 +185,9 @@ class AgentsModal(ModalScreen):
     ]
 
     def compose(self) -> ComposeResult:
-        architects = list_architects()
-        narrators = list_narrators()
-        editors = list_editors()
-        character_agents = list_character_agent_types()
-
-        content = ["Available Agents", ""]
-        content.append("Architects:")
-        content.extend(f"  - {name}" for name in architects)
-        content.append("")
-        content.append("Narrators:")
-        content.extend(f"  - {name}" for name in narrators)
-        content.append("")
-        content.append("Editors:")
-        content.extend(f"  - {name}" for name in editors)
-        content.append("")
-        content.append("Character Agents:")
-        content.extend(f"  - {name}" for name in character_agents)
-        content.append("")
-        content.append("Press ESC to close")
-
         with Center():
             with Vertical():
-                yield Static("\n".join(content))
+                yield Static(_render_agents_text())
 
 
 class StoryLordApp(App):